@@ -1,3 +1,3 @@
-from fastapi_docx.openapi import custom_openapi
+from fastapi_docx.openapi import custom_openapi, offload_openapi, prewarm_openapi
 
-__all__ = ["custom_openapi"]
+__all__ = ["custom_openapi", "offload_openapi", "prewarm_openapi"]
@@ -0,0 +1,4 @@
+from fastapi_docx.cli import main
+
+if __name__ == "__main__":
+    main()
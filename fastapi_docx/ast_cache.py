@@ -0,0 +1,112 @@
+import ast
+import inspect
+import os
+import textwrap
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any, NamedTuple
+
+from fastapi_docx.bytecode import decompile
+from fastapi_docx.function_summary import FunctionSummary
+from fastapi_docx.source_cache import index_summary
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def read_source_tree(obj: Any) -> ast.Module:
+    return ast.parse(textwrap.dedent(inspect.getsource(obj)))
+
+
+def summarize_definition(obj: Any) -> FunctionSummary:
+    """Summarize an object from the index of its module, parsing only its own source if it isn't indexed."""
+    if (summary := index_summary(obj)) is None:
+        summary = FunctionSummary.from_tree(read_source_tree(obj))
+    return summary
+
+
+def summarize_decompiled(obj: Any) -> FunctionSummary:
+    return FunctionSummary.from_tree(decompile(obj))
+
+
+class ASTCache:
+    """A bounded LRU cache of parsed source summaries shared by every `RouteExcFinder`.
+
+    Entries are keyed by the code object of a function (or by the class itself, for classes)
+    together with the modification time of the file it was loaded from,
+    so editing a source file invalidates its entries without clearing the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        summarize: Callable[[Any], FunctionSummary] | None = None,
+    ):
+        self.maxsize = maxsize
+        # Summarizes the source of an object by default. See `bytecode_cache` for an alternative.
+        self._summarize = summarize or summarize_definition
+        self.hits = 0
+        self.misses = 0
+        self._summaries: OrderedDict[
+            tuple[Hashable, int | None], FunctionSummary
+        ] = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(obj: Any) -> tuple[Hashable, int | None]:
+        if code := getattr(obj, "__code__", None):
+            filename = code.co_filename
+        else:
+            code = obj
+            filename = inspect.getsourcefile(obj)
+        try:
+            mtime = os.stat(filename).st_mtime_ns if filename else None
+        except OSError:
+            mtime = None
+        return code, mtime
+
+    def summarize(self, obj: Any) -> FunctionSummary:
+        """Return the summary of the source of a function, method or class."""
+        unwrapped = inspect.unwrap(obj)
+        key = self._key(unwrapped)
+        with self._lock:
+            if (summary := self._summaries.get(key)) is not None:
+                self._summaries.move_to_end(key)
+                self.hits += 1
+                return summary
+            self.misses += 1
+
+        summary = self._summarize(unwrapped)
+        with self._lock:
+            self._summaries[key] = summary
+            if len(self._summaries) > self.maxsize:
+                self._summaries.popitem(last=False)
+        return summary
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._summaries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._summaries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+ast_cache = ASTCache()
+# Summaries rebuilt from bytecode, for the finder's "bytecode" engine.
+bytecode_cache = ASTCache(summarize=summarize_decompiled)
+
+
+def summarize_source(obj: Any) -> FunctionSummary:
+    return ast_cache.summarize(obj)
+
+
+def summarize_bytecode(obj: Any) -> FunctionSummary:
+    return bytecode_cache.summarize(obj)
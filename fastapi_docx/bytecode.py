@@ -0,0 +1,376 @@
+import ast
+import dis
+import inspect
+from functools import lru_cache
+from types import CodeType
+from typing import Any
+
+GLOBAL_LOADS = frozenset({"LOAD_GLOBAL", "LOAD_NAME"})
+LOCAL_LOADS = frozenset(
+    {
+        "LOAD_FAST",
+        "LOAD_FAST_CHECK",
+        "LOAD_FAST_AND_CLEAR",
+        "LOAD_DEREF",
+        "LOAD_CLASSDEREF",
+        "LOAD_FROM_DICT_OR_DEREF",
+    }
+)
+STORES = frozenset({"STORE_FAST", "STORE_NAME", "STORE_GLOBAL", "STORE_DEREF"})
+# Instructions that don't change the values on the stack as they're modelled here.
+NO_OPS = frozenset(
+    {
+        "NOP",
+        "RESUME",
+        "CACHE",
+        "EXTENDED_ARG",
+        "PRECALL",
+        "PUSH_NULL",
+        "MAKE_CELL",
+        "COPY_FREE_VARS",
+        "CONVERT_VALUE",
+        "RETURN_CONST",
+    }
+)
+BINARY_OPERATORS: dict[str, type[ast.operator]] = {
+    "+": ast.Add,
+    "BINARY_ADD": ast.Add,
+    "-": ast.Sub,
+    "BINARY_SUBTRACT": ast.Sub,
+    "*": ast.Mult,
+    "BINARY_MULTIPLY": ast.Mult,
+    "/": ast.Div,
+    "BINARY_TRUE_DIVIDE": ast.Div,
+    "//": ast.FloorDiv,
+    "BINARY_FLOOR_DIVIDE": ast.FloorDiv,
+    "%": ast.Mod,
+    "BINARY_MODULO": ast.Mod,
+}
+# Stands in for a value that couldn't be rebuilt. Evaluating it raises a `NameError`, like any other unknown name.
+UNKNOWN = "__unknown__"
+
+
+@lru_cache(maxsize=4096)
+def global_names(code: CodeType) -> tuple[str, ...]:
+    """Return the global names loaded by a code object and the code objects nested in it
+    (comprehensions, lambdas and inner functions), in order of first use.
+
+    Unlike `co_names`, attribute names (e.g. `bar` in `foo.bar()`) are not included.
+    """
+    names: dict[str, None] = {}
+    for instruction in dis.get_instructions(code):
+        if instruction.opname in GLOBAL_LOADS:
+            names.setdefault(instruction.argval, None)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names.update(dict.fromkeys(global_names(const)))
+    return tuple(names)
+
+
+@lru_cache(maxsize=4096)
+def raises_exception(code: CodeType) -> bool:
+    """Whether a code object (or any code object nested in it) raises an exception other than a bare re-raise."""
+    return any(
+        instruction.opname == "RAISE_VARARGS" and instruction.arg
+        for instruction in dis.get_instructions(code)
+    ) or any(
+        raises_exception(const)
+        for const in code.co_consts
+        if isinstance(const, CodeType)
+    )
+
+
+class CodeDecompiler:
+    """Rebuild the calls, assignments and raise statements of one code object by simulating its value stack.
+
+    Only straight-line expressions built from names, attributes, constants, calls, containers,
+    f-strings and arithmetic are rebuilt. The stack is reset at jump targets and at any other instruction,
+    so values that can't be rebuilt become `UNKNOWN` names rather than misattributed ones.
+    """
+
+    def __init__(self, code: CodeType):
+        self.code = code
+        self.stack: list[ast.expr] = []
+        self.kw_names: tuple[str, ...] = ()
+        self.statements: list[ast.stmt] = []
+        self.calls: list[ast.Call] = []
+
+    def decompile(self) -> list[ast.stmt]:
+        for instruction in dis.get_instructions(self.code):
+            if getattr(instruction, "is_jump_target", False):
+                self.stack.clear()
+            self.step(instruction)
+        # Calls whose results were discarded (or consumed by instructions that aren't modelled) become expression statements.
+        consumed = {
+            id(node)
+            for root in (*self.statements, *self.calls)
+            for node in ast.walk(root)
+            if node is not root or isinstance(root, ast.stmt)
+        }
+        self.statements += [
+            ast.Expr(value=call) for call in self.calls if id(call) not in consumed
+        ]
+        return self.statements
+
+    def push(self, node: ast.expr) -> None:
+        self.stack.append(node)
+
+    def pop(self) -> ast.expr:
+        return self.stack.pop() if self.stack else ast.Name(id=UNKNOWN, ctx=ast.Load())
+
+    def pop_n(self, n: int) -> list[ast.expr]:
+        values = [self.pop() for _ in range(n)]
+        values.reverse()
+        return values
+
+    def call(self, argc: int, kw_names: tuple[str, ...] = ()) -> None:
+        args = self.pop_n(argc)
+        func = self.pop()
+        n_positional = len(args) - len(kw_names)
+        call = ast.Call(
+            func=func,
+            args=args[:n_positional],
+            keywords=[
+                ast.keyword(arg=name, value=value)
+                for name, value in zip(kw_names, args[n_positional:])
+            ],
+        )
+        self.calls.append(call)
+        self.push(call)
+
+    def step(self, instruction: dis.Instruction) -> None:
+        op, argval = instruction.opname, instruction.argval
+        # Instructions without an argument (e.g. `POP_TOP`) have an `arg` of None.
+        arg = instruction.arg or 0
+        if op in NO_OPS:
+            pass
+        elif op in GLOBAL_LOADS or op in LOCAL_LOADS:
+            self.push(ast.Name(id=argval, ctx=ast.Load()))
+        elif op == "LOAD_FAST_LOAD_FAST":
+            for name in argval:
+                self.push(ast.Name(id=name, ctx=ast.Load()))
+        elif op == "LOAD_CONST":
+            self.push(
+                ast.Name(id=UNKNOWN, ctx=ast.Load())
+                if isinstance(argval, CodeType)
+                else ast.Constant(value=argval)
+            )
+        elif op in ("LOAD_ATTR", "LOAD_METHOD"):
+            self.push(ast.Attribute(value=self.pop(), attr=argval, ctx=ast.Load()))
+        elif op == "KW_NAMES":
+            self.kw_names = (
+                argval if isinstance(argval, tuple) else self.code.co_consts[arg]
+            )
+        elif op == "CALL":
+            self.call(arg, self.kw_names)
+            self.kw_names = ()
+        elif op in ("CALL_KW", "CALL_FUNCTION_KW"):
+            kw_names = self.pop()
+            self.call(arg, kw_names.value if isinstance(kw_names, ast.Constant) else ())
+        elif op in ("CALL_FUNCTION", "CALL_METHOD"):
+            self.call(arg)
+        elif op == "BINARY_OP" or op in BINARY_OPERATORS:
+            right, left = self.pop(), self.pop()
+            operator = BINARY_OPERATORS.get(
+                op if op != "BINARY_OP" else instruction.argrepr.rstrip("=")
+            )
+            self.push(
+                ast.BinOp(left=left, op=operator(), right=right)
+                if operator
+                else ast.Name(id=UNKNOWN, ctx=ast.Load())
+            )
+        elif op == "BINARY_SUBSCR":
+            index, value = self.pop(), self.pop()
+            self.push(ast.Subscript(value=value, slice=index, ctx=ast.Load()))
+        elif op in ("FORMAT_VALUE", "FORMAT_SIMPLE", "FORMAT_WITH_SPEC"):
+            if op == "FORMAT_WITH_SPEC" or (op == "FORMAT_VALUE" and arg & 0x04):
+                self.pop()
+            self.push(
+                ast.FormattedValue(value=self.pop(), conversion=-1, format_spec=None)
+            )
+        elif op == "BUILD_STRING":
+            self.push(
+                ast.JoinedStr(
+                    values=[
+                        value
+                        if isinstance(value, ast.FormattedValue)
+                        or (
+                            isinstance(value, ast.Constant)
+                            and isinstance(value.value, str)
+                        )
+                        else ast.FormattedValue(
+                            value=value, conversion=-1, format_spec=None
+                        )
+                        for value in self.pop_n(arg)
+                    ]
+                )
+            )
+        elif op in ("BUILD_LIST", "BUILD_TUPLE", "BUILD_SET"):
+            node_type = {"BUILD_LIST": ast.List, "BUILD_TUPLE": ast.Tuple}.get(
+                op, ast.Set
+            )
+            elts = self.pop_n(arg)
+            self.push(
+                ast.Set(elts=elts)
+                if node_type is ast.Set
+                else node_type(elts=elts, ctx=ast.Load())
+            )
+        elif op in ("LIST_EXTEND", "SET_UPDATE"):
+            extension = self.pop()
+            target = self.pop()
+            if isinstance(target, (ast.List, ast.Set)) and isinstance(
+                extension, ast.Constant
+            ):
+                target.elts += [ast.Constant(value=value) for value in extension.value]
+                self.push(target)
+            else:
+                self.push(ast.Name(id=UNKNOWN, ctx=ast.Load()))
+        elif op == "LIST_TO_TUPLE":
+            value = self.pop()
+            self.push(
+                ast.Tuple(elts=value.elts, ctx=ast.Load())
+                if isinstance(value, ast.List)
+                else value
+            )
+        elif op == "BUILD_MAP":
+            items = self.pop_n(2 * arg)
+            self.push(ast.Dict(keys=items[::2], values=items[1::2]))
+        elif op == "BUILD_CONST_KEY_MAP":
+            keys = self.pop()
+            map_values = self.pop_n(arg)
+            self.push(
+                ast.Dict(
+                    keys=[ast.Constant(value=key) for key in keys.value],
+                    values=map_values,
+                )
+                if isinstance(keys, ast.Constant)
+                else ast.Name(id=UNKNOWN, ctx=ast.Load())
+            )
+        elif op in STORES:
+            self.statements.append(
+                ast.Assign(
+                    targets=[ast.Name(id=argval, ctx=ast.Store())],
+                    value=self.pop(),
+                )
+            )
+        elif op in ("POP_TOP", "RETURN_VALUE"):
+            self.pop()
+        elif op == "RAISE_VARARGS":
+            raised = self.pop_n(arg)
+            if raised:
+                self.statements.append(
+                    ast.Raise(exc=raised[0], cause=raised[1] if arg == 2 else None)
+                )
+        elif op.startswith("POP_JUMP") and "NONE" not in op:
+            self.pop()
+        else:
+            self.stack.clear()
+            self.kw_names = ()
+
+
+def decompile_code(code: CodeType) -> list[ast.stmt]:
+    """Rebuild the statements of a code object and every code object nested in it."""
+    statements = CodeDecompiler(code).decompile()
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            statements += decompile_code(const)
+    return statements
+
+
+def reference(obj: Any, namespace: dict[str, Any]) -> ast.expr | None:
+    """Rebuild an expression that refers to `obj` from a module's `namespace`, e.g. `UserDeps.get_user`."""
+    for name, value in namespace.items():
+        if value is obj:
+            return ast.Name(id=name, ctx=ast.Load())
+    if inspect.ismethod(obj):
+        owner = reference(obj.__self__, namespace)
+    else:
+        owner_name, _, name = getattr(obj, "__qualname__", "").rpartition(".")
+        owner = (
+            ast.Name(id=owner_name, ctx=ast.Load())
+            if owner_name in namespace and name == getattr(obj, "__name__", None)
+            else None
+        )
+    return (
+        ast.Attribute(value=owner, attr=obj.__name__, ctx=ast.Load()) if owner else None
+    )
+
+
+def decompile_function(func: Any) -> ast.FunctionDef:
+    """Rebuild a function definition from its code object, including any `Depends` defaults
+    and the annotations of keyword-only arguments (where they can be referred to by name)."""
+    code = func.__code__
+    namespace = getattr(func, "__globals__", {})
+    defaults = []
+    for default in (*(func.__defaults__ or ()), *(func.__kwdefaults__ or {}).values()):
+        if (dependency := getattr(default, "dependency", None)) and (
+            dependency_ref := reference(dependency, namespace)
+        ):
+            defaults.append(
+                ast.Call(
+                    func=ast.Name(id="Depends", ctx=ast.Load()),
+                    args=[dependency_ref],
+                    keywords=[],
+                )
+            )
+    annotations = getattr(func, "__annotations__", {})
+    kwonlyargs = []
+    kwonly_start = code.co_argcount
+    kwonly_end = kwonly_start + code.co_kwonlyargcount
+    for name in code.co_varnames[kwonly_start:kwonly_end]:
+        annotation = annotations.get(name)
+        kwonlyargs.append(
+            ast.arg(
+                arg=name,
+                annotation=ast.Name(id=annotation, ctx=ast.Load())
+                if isinstance(annotation, str) and annotation.isidentifier()
+                else reference(annotation, namespace)
+                if annotation is not None
+                else None,
+            )
+        )
+    return ast.FunctionDef(
+        name=func.__name__,
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[],
+            vararg=None,
+            kwonlyargs=kwonlyargs,
+            kw_defaults=[],
+            kwarg=None,
+            defaults=defaults,
+        ),
+        body=decompile_code(code) or [ast.Pass()],
+        decorator_list=[],
+        returns=None,
+        type_comment=None,
+        lineno=code.co_firstlineno,
+    )
+
+
+def class_functions(cls: type) -> list[Any]:
+    """Every function defined in the body of a class, including static and class methods and property accessors."""
+    functions = []
+    for value in vars(cls).values():
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        if isinstance(value, property):
+            functions += [f for f in (value.fget, value.fset, value.fdel) if f]
+        elif hasattr(inspect.unwrap(value), "__code__"):
+            functions.append(inspect.unwrap(value))
+    return functions
+
+
+def decompile(obj: Any) -> ast.Module:
+    """Rebuild the parts of the syntax tree of a function, method or class that the exception finder reads,
+    from bytecode alone. No source file is needed."""
+    functions = class_functions(obj) if isinstance(obj, type) else [inspect.unwrap(obj)]
+    tree = ast.Module(
+        body=[
+            decompile_function(func)
+            for func in functions
+            if isinstance(getattr(func, "__code__", None), CodeType)
+        ],
+        type_ignores=[],
+    )
+    return ast.fix_missing_locations(tree)
@@ -0,0 +1,121 @@
+import argparse
+import importlib
+import sys
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import FastAPI
+
+from fastapi_docx.exception_finder import ENGINES
+from fastapi_docx.openapi import custom_openapi, ignore_prebuilt_spec
+from fastapi_docx.spec_cache import write_json
+
+
+def import_from_string(import_str: str) -> Any:
+    module_name, _, attrs = import_str.partition(":")
+    if not module_name or not attrs:
+        raise ValueError(
+            f'Import string "{import_str}" must be in format "<module>:<attribute>".'
+        )
+    obj = importlib.import_module(module_name)
+    for attr in attrs.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m fastapi_docx",
+        description="Pre-generate the OpenAPI specification of a FastAPI app.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser(
+        "build",
+        help="Write the OpenAPI specification of an app to a file.",
+        description=(
+            "Write the OpenAPI specification of an app to a file. "
+            "If no exception or class options are given, the app's own `app.openapi` is used, "
+            "e.g. as configured with `app.openapi = custom_openapi(app, ...)`. "
+            "The app is always searched for exceptions, even if it's configured with a `prebuilt_spec`."
+        ),
+    )
+    build.add_argument("app", help='The app to document, e.g. "main:app".')
+    build.add_argument(
+        "-o", "--output", default="openapi.json", help="Defaults to openapi.json."
+    )
+    build.add_argument(
+        "--app-dir",
+        default=".",
+        help="A directory to add to sys.path before importing the app. Defaults to the current directory.",
+    )
+    build.add_argument("--custom-error", metavar="IMPORT_STRING")
+    build.add_argument("--custom-err-schema", metavar="IMPORT_STRING")
+    build.add_argument("--http-exc-schema", metavar="IMPORT_STRING")
+    build.add_argument(
+        "--dependency-class", action="append", default=[], metavar="IMPORT_STRING"
+    )
+    build.add_argument(
+        "--service-class", action="append", default=[], metavar="IMPORT_STRING"
+    )
+    build.add_argument("--max-depth", type=int)
+    build.add_argument("--max-functions", type=int)
+    build.add_argument(
+        "--engine",
+        choices=ENGINES,
+        help="Find exceptions by parsing source (the default) or by decompiling bytecode.",
+    )
+    return parser
+
+
+def build_openapi(app: FastAPI, **kwargs: Any) -> dict[str, Any]:
+    """Build the OpenAPI spec of `app` with `custom_openapi`, or with `app.openapi` if no options are given.
+
+    Any `prebuilt_spec` the app is configured with is ignored, so the spec is always built from the app itself.
+    """
+    app.openapi_schema = None
+    token = ignore_prebuilt_spec.set(True)
+    try:
+        if options := {
+            key: value for key, value in kwargs.items() if value is not None
+        }:
+            openapi_schema: dict[str, Any] = custom_openapi(app, **options)()
+        else:
+            openapi_schema = app.openapi()
+    finally:
+        ignore_prebuilt_spec.reset(token)
+    return openapi_schema
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    sys.path.insert(0, args.app_dir)
+
+    try:
+        app = import_from_string(args.app)
+        classes = {
+            "customError": args.custom_error,
+            "customErrSchema": args.custom_err_schema,
+            "HTTPExcSchema": args.http_exc_schema,
+        }
+        kwargs = {
+            key: import_from_string(value) if value else None
+            for key, value in classes.items()
+        }
+        kwargs["dependencyClasses"] = (
+            tuple(import_from_string(cls) for cls in args.dependency_class) or None
+        )
+        kwargs["serviceClasses"] = (
+            tuple(import_from_string(cls) for cls in args.service_class) or None
+        )
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(str(e))
+
+    openapi_schema = build_openapi(
+        app,
+        max_depth=args.max_depth,
+        max_functions=args.max_functions,
+        engine=args.engine,
+        **kwargs,
+    )
+    write_json(args.output, openapi_schema)
@@ -1,67 +1,110 @@
 import ast
 import importlib
 import inspect
-import textwrap
+import logging
+import threading
+import time
 import typing
-from collections.abc import Callable, Generator, Iterable
-from itertools import chain
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
 from types import ModuleType
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
-from fastapi import status  # noqa
+import fastapi
+from fastapi.dependencies.models import Dependant
 from fastapi.routing import APIRoute
 from starlette.exceptions import HTTPException
 
+from fastapi_docx.ast_cache import summarize_bytecode, summarize_source
+from fastapi_docx.bytecode import global_names, raises_exception
+from fastapi_docx.function_summary import FunctionSummary
+from fastapi_docx.static_eval import NotStatic, fold_call_arguments
+from fastapi_docx.symbols import ExceptionRegistry, ModuleSymbols, dotted_name
+
 ErrType = TypeVar("ErrType", bound=Exception)
-AstType = TypeVar("AstType", bound=ast.AST)
-
-
-def find_nodes(
-    tree: ast.Module,
-    node_type: type[AstType],
-    attr_filter: dict[str, type[ast.AST]] | None = None,
-) -> Generator[AstType, None, None]:
-    if attr_filter:
-        for node in ast.walk(tree):
-            if isinstance(node, node_type) and all(
-                hasattr(node, node_attr)
-                and isinstance(getattr(node, node_attr), attr_type)
-                for node_attr, attr_type in attr_filter.items()
-            ):
-                yield node
-    else:
-        for node in ast.walk(tree):
-            if isinstance(node, node_type):
-                yield node
+
+# Whether to find exceptions by parsing source files ("ast") or by decompiling code objects ("bytecode").
+Engine = Literal["ast", "bytecode"]
+ENGINES: tuple[Engine, ...] = ("ast", "bytecode")
+
+logger = logging.getLogger(__name__)
+
+
+class TimeBudgetExceeded(Exception):
+    """Raised when searching a route for exceptions runs past its deadline."""
+
+
+@dataclass(frozen=True, slots=True)
+class ExceptionRecord:
+    """The parts of a found exception needed to document it, as plain (picklable) data.
+
+    Attributes:
+        `status_code`: The status code of the response.
+        `detail`: The detail of the exception, if it has one.
+        `qualname`: The qualified name of the exception's class, e.g. `AppExc.CreateFailed`.
+        `custom`: Whether it's an instance of the `customError` class.
+        `location`: The file and first line of the function that raises it, if known.
+    """
+
+    status_code: int
+    # The detail may be unhashable, e.g. a dict.
+    detail: Any = field(hash=False)
+    qualname: str
+    custom: bool = False
+    location: tuple[str, int] | None = None
+
+    @property
+    def name(self) -> str:
+        """The name of the exception's class, e.g. `CreateFailed`."""
+        return self.qualname.rpartition(".")[2]
+
+
+def exception_record(
+    exc: HTTPException | ErrType,
+    customError: type[ErrType] | None = None,
+    location: tuple[str, int] | None = None,
+) -> ExceptionRecord:
+    return ExceptionRecord(
+        getattr(exc, "status_code"),
+        getattr(exc, "detail", None),
+        exc.__class__.__qualname__,
+        bool(customError and isinstance(exc, customError)),
+        location,
+    )
 
 
 def is_function_or_coroutine(obj: Any) -> bool:
     return inspect.isfunction(obj) or inspect.iscoroutinefunction(obj)
 
 
-def is_subclass_of_any(klass: type, classes: Iterable[type] | Iterable[str]) -> bool:
+def is_subclass_of_any(klass: Any, classes: Iterable[type] | Iterable[str]) -> bool:
+    """Whether a class (or the class of an instance) is any of `classes` or a subclass of one, at any depth.
+
+    Classes are compared by identity along the method resolution order. Classes can also be given by name,
+    in which case any class of that name in the method resolution order matches.
+    Results are memoized per class and set of classes.
+    """
+    cls = klass if isinstance(klass, type) else type(klass)
     try:
-        base_names = (
-            [base.__name__ for base in klass.__bases__]
-            if hasattr(klass, "__bases__")
-            else []
-        )
-        base_names.append(type(klass).__name__)
-        if all(isinstance(cls, str) for cls in classes):
-            class_names = classes
-        else:
-            class_names = [
-                cls.__name__  # pyright: ignore
-                for cls in classes
-                if hasattr(cls, "__name__")
-            ]
-        return any(
-            base_name in class_names for base_name in base_names  # pyright: ignore
-        )
-    except RuntimeError:
+        return _is_subclass_of_any(cls, tuple(classes))
+    except TypeError:
+        # Unhashable classes, or classes whose subclass checks fail.
         return False
 
 
+@lru_cache(maxsize=4096)
+def _is_subclass_of_any(cls: type, classes: tuple[type | str, ...]) -> bool:
+    mro = inspect.getmro(cls)
+    return any(
+        any(base.__name__ == target for base in mro)
+        if isinstance(target, str)
+        else target in mro
+        for target in classes
+    )
+
+
 def is_callable_instance(obj: object) -> bool:
     return hasattr(obj, "__call__") and not isinstance(obj, type)
 
@@ -81,6 +124,41 @@ def get_annotated_dependency(annot: Any) -> Callable | None:
     return dependency
 
 
+def iter_dependencies(dependant: Dependant) -> Iterator[Callable]:
+    """Yield each dependency resolved by FastAPI for a route once, including sub-dependencies
+    and router or app level dependencies, with every dependency before its own sub-dependencies."""
+    seen: set[int] = set()
+    stack = list(reversed(dependant.dependencies))
+    while stack:
+        sub_dependant = stack.pop()
+        call = sub_dependant.call
+        if call is None or id(call) in seen:
+            continue
+        seen.add(id(call))
+        yield call
+        stack.extend(reversed(sub_dependant.dependencies))
+
+
+def get_dependency_owner(dependency: Callable) -> tuple[Any, str | None]:
+    """Return the object a dependency is defined on and its name there.
+
+    Bound methods are owned by the instance (or class) they're bound to,
+    and functions defined in a class body (e.g. static methods) by that class.
+    A class or callable instance owns itself, and a plain function has no owner.
+    """
+    if inspect.ismethod(dependency):
+        return dependency.__self__, dependency.__name__
+    if not is_function_or_coroutine(dependency):
+        return dependency, None
+    qualname = dependency.__qualname__
+    if "." not in qualname or "<locals>" in qualname:
+        return None, None
+    owner: Any = inspect.getmodule(dependency)
+    for name in qualname.split(".")[:-1]:
+        owner = getattr(owner, name, None)
+    return owner, dependency.__name__
+
+
 def create_exc_instance(
     exc_class: type[Exception], exc_args: list[Any] | None = None
 ) -> Exception | None:
@@ -89,125 +167,446 @@ def create_exc_instance(
     return value if isinstance(value, Exception) else None
 
 
-def replace_binops(node: ast.AST) -> None:
-    """Replace binary addition operations with their string representation."""
-    for name, field in ast.iter_fields(node):
-        if isinstance(field, list):
-            for i, item in enumerate(field):
-                if isinstance(item, ast.BinOp) and isinstance(item.op, ast.Add):
-                    field[i] = ast.Constant(
-                        value=f"<{ast.unparse(item.left)}> + <{ast.unparse(item.right)}>"
-                    )
-                else:
-                    replace_binops(item)
-        elif isinstance(field, ast.AST):
-            if isinstance(field, ast.BinOp) and isinstance(field.op, ast.Add):
-                setattr(
-                    node,
-                    name,
-                    ast.Constant(
-                        value=f"<{ast.unparse(field.left)}> + <{ast.unparse(field.right)}>"
-                    ),
-                )
-            else:
-                replace_binops(field)
+# Constructors that only store their arguments, so exceptions using them can be created from folded arguments.
+STOCK_INITS = {HTTPException.__init__, fastapi.HTTPException.__init__}
 
 
-def replace_formatted_values(node: ast.AST) -> None:
-    """Replace formatted values with their string representation."""
-    for name, field in ast.iter_fields(node):
-        if isinstance(field, list):
-            for i, item in enumerate(field):
-                if isinstance(item, ast.FormattedValue):
-                    field[i] = ast.Constant(
-                        value=f"<{ast.unparse(item.value).upper()}>"
-                    )
-                else:
-                    replace_formatted_values(item)
-                    replace_binops(item)
-        elif isinstance(field, ast.AST):
-            if isinstance(field, ast.FormattedValue):
-                setattr(
-                    node,
-                    name,
-                    ast.Constant(value=f"<{ast.unparse(field.value).upper()}>"),
-                )
-            else:
-                replace_formatted_values(field)
-                replace_binops(field)
-    return None
+def eval_ast_exc_instance(
+    exc_class: type[Exception],
+    ast_exec_inst: ast.Call,
+    namespace: dict[str, Any] | None = None,
+) -> Exception | None:
+    """Create an exception as raised by a `raise` statement, from the arguments in its syntax tree.
+
+    Arguments are folded to constants without evaluating any code (see `fold`),
+    looking up any names in the `namespace` of the module that raises the exception. Only exceptions with a stock
+    `HTTPException` constructor are created this way: `NotStatic` is raised for any other, for calls with
+    unpacked arguments, and for calls that don't give a status code known before runtime
+    (e.g. `raise Locked()` for a subclass with a `status_code` class attribute).
+    """
+    if exc_class.__init__ not in STOCK_INITS:
+        raise NotStatic(ast_exec_inst)
+    args, kwargs = fold_call_arguments(ast_exec_inst, namespace)
+    try:
+        bound = inspect.signature(exc_class).bind(*args, **kwargs)
+    except TypeError:
+        raise NotStatic(ast_exec_inst)
+    if not isinstance(bound.arguments.get("status_code"), int):
+        raise NotStatic(ast_exec_inst)
+    try:
+        return exc_class(*bound.args, **bound.kwargs)
+    except ValueError:
+        # A status code without a standard reason phrase, and no detail.
+        return None
 
 
-def eval_ast_exc_instance(
-    exc_class: type[Exception], ast_exec_inst: ast.expr
+# The name of an optional classmethod on exception classes that returns the `status_code` (and optionally
+# the `detail`) to document them with, e.g. for exceptions whose constructors need arguments.
+METADATA_HOOK = "docx_metadata"
+
+# An instance of each exception class to document it with, or None if the class needs constructor arguments.
+_prototypes: dict[type[Exception], Exception | None] = {}
+_prototypes_lock = threading.Lock()
+
+
+def exception_from_metadata(
+    exc_class: type[Exception], status_code: int, detail: Any = None
+) -> Exception:
+    """Create an exception with the given attributes, without calling its constructor."""
+    exc = exc_class.__new__(exc_class)
+    exc.status_code = status_code  # type: ignore[attr-defined]
+    exc.detail = detail  # type: ignore[attr-defined]
+    return exc
+
+
+def class_attributes(cls: type) -> dict[str, Any]:
+    """The attributes defined on a class and its bases (other than `object`), without triggering descriptors."""
+    attrs: dict[str, Any] = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        attrs.update(vars(klass))
+    return attrs
+
+
+def exception_from_attributes(exc_class: type[Exception]) -> Exception | None:
+    """Create an exception from the `status_code` (and `detail`) attributes of its class and bases, if it has them."""
+    attributes = class_attributes(exc_class)
+    if not isinstance(status_code := attributes.get("status_code"), int):
+        return None
+    detail = attributes.get("detail")
+    return exception_from_metadata(
+        exc_class, status_code, detail if isinstance(detail, str) else None
+    )
+
+
+def exception_prototype(exc_class: type[Exception]) -> Exception | None:
+    """Return an instance of an exception class to document it with, created once per class.
+
+    It's made from the class's `docx_metadata` hook if it has one, or else from its `status_code`
+    (and `detail`) class attributes if it defines them itself and doesn't override the constructor.
+    Otherwise its constructor is called without arguments.
+    Returns None if the constructor needs arguments (or fails).
+    """
+    with _prototypes_lock:
+        if exc_class in _prototypes:
+            return _prototypes[exc_class]
+    own_attributes = vars(exc_class)
+    if hook := getattr(exc_class, METADATA_HOOK, None):
+        metadata = hook()
+        prototype: Exception | None = exception_from_metadata(
+            exc_class, metadata["status_code"], metadata.get("detail")
+        )
+    elif (
+        isinstance(own_attributes.get("status_code"), int)
+        and "__init__" not in own_attributes
+    ):
+        prototype = exception_from_attributes(exc_class)
+    else:
+        # A constructor may pass its own status code to `super().__init__`, overriding any inherited attributes.
+        try:
+            prototype = create_exc_instance(exc_class)
+        except Exception:
+            prototype = None
+        if not isinstance(getattr(prototype, "status_code", None), int):
+            prototype = None
+    with _prototypes_lock:
+        _prototypes[exc_class] = prototype
+    return prototype
+
+
+def instantiate_exception(
+    exc_class: type[Exception],
+    call: ast.Call,
+    namespace: dict[str, Any] | None = None,
 ) -> Exception | None:
-    importlib.import_module(exc_class.__module__)
-    replace_formatted_values(ast_exec_inst)
-    value = eval(ast.unparse(ast_exec_inst))
-    return value if isinstance(value, Exception) else None
+    """Create an exception to document a `raise exc_class(...)` statement with.
+
+    The class's prototype is used if it has one (see `exception_prototype`). Otherwise the constructor
+    is called with the arguments of the raise statement, as far as they can be folded (see `fold`),
+    unless it's a stock `HTTPException` constructor that `eval_ast_exc_instance` couldn't call either.
+    If that fails too, the exception is made from its class attributes, if it has them.
+    """
+    if (prototype := exception_prototype(exc_class)) is not None:
+        return prototype
+    if exc_class.__init__ in STOCK_INITS:
+        return exception_from_attributes(exc_class)
+    try:
+        args, kwargs = fold_call_arguments(call, namespace)
+        return exc_class(*args, **kwargs)
+    except Exception as e:
+        if (exc := exception_from_attributes(exc_class)) is not None:
+            return exc
+        logger.warning(
+            "Could not create %s from `%s`: %s",
+            exc_class.__qualname__,
+            ast.unparse(call),
+            e,
+        )
+        return None
 
 
 class RouteExcFinder:
     def __init__(
         self,
         customError: type[ErrType] | None = None,
-        dependencyClasses: tuple[type] | None = None,
-        serviceClasses: tuple[type] | None = None,
+        dependencyClasses: tuple[type, ...] | None = None,
+        serviceClasses: tuple[type, ...] | None = None,
+        max_depth: int | None = None,
+        max_functions: int | None = None,
+        engine: Engine = "ast",
+        first_per_status: bool = False,
     ):
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, not {engine!r}")
         self.customError = customError
         self.dependencyClasses = dependencyClasses
         self.serviceClasses = serviceClasses
+        self.max_depth = max_depth
+        self.max_functions = max_functions
+        self.engine = engine
+        # Keep only the first exception found per status code, as documented in the spec.
+        self.first_per_status = first_per_status
+        self._summarize = (
+            summarize_bytecode if engine == "bytecode" else summarize_source
+        )
 
-        self.exceptions_to_find: tuple[str, ...] = (
-            ("HTTPException", self.customError.__name__)
-            if self.customError
-            else ("HTTPException",)
+        self.exceptions_to_find: tuple[type[Exception], ...] = (
+            (HTTPException, self.customError) if self.customError else (HTTPException,)
         )
 
-        self.functions: list[Callable] = []
-        self.exceptions: list[HTTPException | ErrType] = []
+        # Finders can be shared by threads, so all per-route state is local to each call.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._truncated_endpoints: set[Callable] = set()
+        # Paths of every source file scanned by this finder.
+        self.source_files: set[str] = set()
+
+        # Exceptions found per callable (and owner), kept across routes for the lifetime of the finder.
+        self.memo: dict[Hashable, list[ExceptionRecord]] = {}
+        # The symbols of each module (or class) searched, by the id of its namespace, with the namespace itself.
+        self._symbols: dict[int, tuple[Any, ModuleSymbols]] = {}
+        self._registry: ExceptionRegistry | None = None
+
+    @property
+    def _in_progress(self) -> set[Hashable]:
+        """The memo keys the current thread is collecting exceptions for."""
+        if (in_progress := getattr(self._local, "in_progress", None)) is None:
+            in_progress = self._local.in_progress = set()
+        return in_progress
+
+    def memoize(
+        self, key: Hashable, find: Callable[[], list[ExceptionRecord]]
+    ) -> list[ExceptionRecord]:
+        """Return the exceptions memoized for `key`, calling `find` to collect them on a miss.
+
+        A key that is requested again while its exceptions are still being collected
+        (i.e. a recursive reference) yields no exceptions rather than recursing forever.
+        Exceptions collected while cutting such a cycle depend on where the search started,
+        so they're returned but not memoized. That way the memo never depends on the order
+        in which routes are searched, or on which thread searched them first.
+        Unhashable keys are never memoized.
+        """
+        try:
+            exceptions = self.memo.get(key)
+        except TypeError:
+            self._check_deadline()
+            return find()
+        if exceptions is not None:
+            return list(exceptions)
+        if key in self._in_progress:
+            self._local.cycles_cut = getattr(self._local, "cycles_cut", 0) + 1
+            return []
+        self._check_deadline()
+        cycles_cut = getattr(self._local, "cycles_cut", 0)
+        self._in_progress.add(key)
+        try:
+            exceptions = find()
+        finally:
+            self._in_progress.discard(key)
+        if getattr(self._local, "cycles_cut", 0) == cycles_cut:
+            self.memo[key] = exceptions
+        return list(exceptions)
+
+    def _check_deadline(self) -> None:
+        deadline = getattr(self._local, "deadline", None)
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeBudgetExceeded
 
     def extract_exceptions(
         self,
         route: APIRoute,
-    ) -> list[HTTPException | ErrType]:
-        self.functions.append(getattr(route, "endpoint", route))
-        self.functions.extend(self.find_functions(route))
-        while len(self.functions) > 0:
-            function = self.functions.pop(0)
-            self.functions.extend(self.find_functions(function))
-            self.exceptions.extend(self.find_exceptions(function))
-        if self.dependencyClasses:
-            self.exceptions += self.find_dependency_exceptions(route)
-        if self.dependencyClasses:
-            self.exceptions += self.find_annotated_dependency_exceptions(route)
+        deadline: float | None = None,
+    ) -> list[ExceptionRecord]:
+        """Find every exception that a route may raise.
+
+        If a `deadline` (in terms of `time.monotonic()`) is given and passes before the search is finished,
+        `TimeBudgetExceeded` is raised. Exceptions found for callables whose search did finish are still memoized.
+        """
+        endpoint = getattr(route, "endpoint", route)
+        # The same endpoint can be included under routers with different dependencies.
+        dependant = getattr(route, "dependant", None)
+        dependencies = (
+            tuple(sub_dependant.call for sub_dependant in dependant.dependencies)
+            if dependant
+            else ()
+        )
+        self._local.deadline = deadline
+        try:
+            return self.memoize(
+                ("route", endpoint, dependencies),
+                lambda: self._extract_exceptions(route),
+            )
+        finally:
+            self._local.deadline = None
+
+    def is_truncated(self, route: APIRoute) -> bool:
+        """Whether the search of a route stopped at `max_depth` or `max_functions`."""
+        return getattr(route, "endpoint", route) in self._truncated_endpoints
+
+    def _extract_exceptions(
+        self,
+        route: APIRoute,
+    ) -> list[ExceptionRecord]:
+        exceptions: list[ExceptionRecord] = []
+        seen: set[Hashable] = set()
+
+        def collect(found: Iterable[ExceptionRecord]) -> None:
+            for exc in found:
+                if (key := self.exception_key(exc)) not in seen:
+                    seen.add(key)
+                    exceptions.append(exc)
+
+        endpoint = getattr(route, "endpoint", route)
+
+        # Dependencies are read from the tree FastAPI already resolved for the route (if it's an `APIRoute`).
+        # Methods of dependency classes are searched (and memoized) per class, so dependencies shared
+        # by every route under a router are only searched once. Other functions are searched like the endpoint.
+        dependant: Dependant | None = getattr(route, "dependant", None)
+        class_dependencies: list[tuple[Any, str | None]] = []
+        function_dependencies: list[Callable] = []
+        for dependency in iter_dependencies(dependant) if dependant else ():
+            owner, attr = get_dependency_owner(dependency)
+            if self.is_dependency_class(owner):
+                class_dependencies.append((owner, attr))
+            elif is_function_or_coroutine(dependency):
+                function_dependencies.append(dependency)
+
+        scanned = 0
+        visited: set[Callable] = set()
+        # The endpoint and everything it calls are searched before the functions it depends on,
+        # so the endpoint's own exceptions come first.
+        for roots in ([endpoint], function_dependencies):
+            worklist: deque[tuple[Callable, int]] = deque(
+                (root, 0) for root in roots if root not in visited
+            )
+            visited.update(roots)
+            while worklist:
+                if self.max_functions is not None and scanned >= self.max_functions:
+                    self._truncate(
+                        endpoint, f"more than {self.max_functions} functions"
+                    )
+                    break
+                function, depth = worklist.popleft()
+                scanned += 1
+                collect(self.find_exceptions(function))
+                for callee in self.find_functions(function):
+                    if callee in visited:
+                        continue
+                    if self.max_depth is not None and depth >= self.max_depth:
+                        self._truncate(endpoint, f"calls deeper than {self.max_depth}")
+                        continue
+                    visited.add(callee)
+                    worklist.append((callee, depth + 1))
+            else:
+                continue
+            break
+        for owner, attr in class_dependencies:
+            assert self.dependencyClasses is not None
+            collect(self.search_method_for_excs(owner, attr, self.dependencyClasses))
+        if self.dependencyClasses and dependant is None:
+            collect(self.find_dependency_exceptions(route))
+            collect(self.find_annotated_dependency_exceptions(route))
         if self.serviceClasses:
-            self.exceptions += self.find_service_exceptions(route)
-        return self.exceptions
+            collect(self.find_service_exceptions(route))
+        return exceptions
 
-    @staticmethod
-    def find_functions(route: Callable) -> list[Callable]:
+    def exception_key(self, record: ExceptionRecord) -> Hashable:
+        """The key by which exceptions found for a route are de-duplicated.
+
+        Exceptions are the same if they have the same status code, class and detail,
+        or (with `first_per_status`) just the same status code.
+        """
+        if self.first_per_status:
+            return record.status_code
+        detail = record.detail
+        try:
+            hash(detail)
+        except TypeError:
+            detail = repr(detail)
+        return record.status_code, record.qualname, detail
+
+    def is_dependency_class(self, obj: Any) -> bool:
+        return bool(
+            self.dependencyClasses
+            and obj is not None
+            and (
+                isinstance(obj, self.dependencyClasses)
+                or is_subclass_of_any(obj, self.dependencyClasses)
+            )
+        )
+
+    def _truncate(self, endpoint: Callable, reason: str) -> None:
+        if endpoint not in self._truncated_endpoints:
+            self._truncated_endpoints.add(endpoint)
+            logger.warning(
+                "Stopped searching %s for exceptions: %s",
+                getattr(endpoint, "__qualname__", endpoint),
+                reason,
+            )
+
+    def symbols(self, owner: ModuleType | type | dict[str, Any]) -> ModuleSymbols:
+        """Return the classified names of a module, class or namespace (e.g. a function's globals), indexed once."""
+        namespace: Any = vars(owner) if isinstance(owner, ModuleType) else owner
+        if (cached := self._symbols.get(id(namespace))) is None:
+            cached = self._symbols[id(namespace)] = (
+                namespace,
+                ModuleSymbols.from_namespace(
+                    class_attributes(namespace)
+                    if isinstance(namespace, type)
+                    else namespace
+                ),
+            )
+        return cached[1]
+
+    @property
+    def registry(self) -> ExceptionRegistry:
+        """Every subclass of the exceptions to find, built the first time a dotted raise target is resolved."""
+        if self._registry is None:
+            self._registry = ExceptionRegistry.from_classes(self.exceptions_to_find)
+        return self._registry
+
+    def summarize(self, obj: Any) -> FunctionSummary:
+        summary = self._summarize(obj)
+        self.record_source_file(obj)
+        return summary
+
+    def record_source_file(self, obj: Any) -> None:
+        unwrapped = inspect.unwrap(obj)
+        source_file = (
+            code.co_filename
+            if (code := getattr(unwrapped, "__code__", None))
+            else inspect.getsourcefile(unwrapped)
+        )
+        if source_file:
+            with self._lock:
+                self.source_files.add(source_file)
+
+    def record_class_source_files(self, cls: type) -> None:
+        """Record the files defining a class and its bases, whose attributes may be documented."""
+        for klass in cls.__mro__:
+            try:
+                self.record_source_file(klass)
+            except TypeError:
+                # Builtin classes have no source file.
+                ...
+
+    def scanned_files(self) -> set[str]:
+        with self._lock:
+            return set(self.source_files)
+
+    def find_functions(self, route: Callable) -> list[Callable]:
+        """Find the module-level functions called (or otherwise referenced) by a function.
+
+        Functions are resolved from the global names loaded by their code objects, so no source is parsed.
+        Anything without a code object of its own falls back to the names in its parsed source.
+        Dependencies passed to `Depends` are found from the route's dependant tree instead.
+        """
         _functions = []
         func = getattr(route, "endpoint", route)
         unwrapped = inspect.unwrap(func)
-        source = textwrap.dedent(inspect.getsource(unwrapped))
-        tree = ast.parse(source)
-        module = importlib.import_module(func.__module__)
-        for node in ast.walk(tree):
-            try:
-                obj = getattr(module, node.id) if hasattr(node, "id") else None
-                if is_function_or_coroutine(obj) and obj is not func:
-                    _functions.append(obj)
-            except (AttributeError, ValueError):
-                ...
+        if (code := getattr(unwrapped, "__code__", None)) is not None:
+            self.record_source_file(unwrapped)
+            functions = self.symbols(unwrapped.__globals__).functions
+            names: Iterable[str] = global_names(code)
+        else:
+            module = importlib.import_module(func.__module__)
+            functions = self.symbols(module).functions
+            names = self.summarize(func).names
+        for name in names:
+            obj = functions.get(name)
+            if (
+                obj is not None
+                and obj is not func
+                and obj is not unwrapped
+                and obj not in _functions
+            ):
+                _functions.append(obj)
         return _functions
 
     def find_exceptions(
         self,
         callable: APIRoute | Callable | str,
         owner: type | ModuleType | None = None,
-    ) -> list[HTTPException]:
-        _exceptions = []
+    ) -> list[ExceptionRecord]:
         callable = callable.endpoint if hasattr(callable, "endpoint") else callable
 
         if isinstance(callable, str):
@@ -215,60 +614,87 @@ class RouteExcFinder:
                 raise ValueError("owner must be provided if callable is a string")
             callable = getattr(owner, callable)
 
-        if module := inspect.getmodule(callable) if owner is not ModuleType else owner:
-            unwrapped = inspect.unwrap(callable)
-            source = textwrap.dedent(inspect.getsource(unwrapped))
-            tree = ast.parse(source)
+        func: Callable = callable
+        return self.memoize(
+            ("exceptions", func, owner),
+            lambda: self._find_exceptions(func, owner),
+        )
 
-            for node in find_nodes(tree, ast.Raise, attr_filter={"exc": ast.Call}):
+    def _find_exceptions(
+        self,
+        callable: Callable,
+        owner: type | ModuleType | None = None,
+    ) -> list[ExceptionRecord]:
+        _exceptions: list[ExceptionRecord] = []
+        if not self.may_raise(callable):
+            self.record_source_file(callable)
+            return _exceptions
+        if module := inspect.getmodule(callable) if owner is not ModuleType else owner:
+            code = getattr(inspect.unwrap(callable), "__code__", None)
+            location = (code.co_filename, code.co_firstlineno) if code else None
+            # Identical raise statements (e.g. in several branches) raise the same exception.
+            raise_sites: set[str] = set()
+            for node in self.summarize(callable).raises:
+                if (site := ast.dump(node)) in raise_sites:
+                    continue
+                raise_sites.add(site)
                 http_exec_instance = self.create_exc_inst_from_raise_stmt(node, module)
                 if http_exec_instance:
-                    _exceptions.append(http_exec_instance)
+                    self.record_class_source_files(type(http_exec_instance))
+                    # Only plain records are kept, rather than the instances and everything they reference.
+                    _exceptions.append(
+                        exception_record(http_exec_instance, self.customError, location)
+                    )
         return _exceptions
 
+    def may_raise(self, callable: Callable) -> bool:
+        """A cheap check, from bytecode alone, of whether a function might raise an exception to find.
+
+        Functions that raise nothing, or only raise exceptions that aren't to be found (e.g. builtins),
+        are skipped without parsing their source. Any global class other than an exception class
+        (e.g. a namespace of exceptions like `AppExc.NotFound`), and any module
+        (e.g. `errors` in `errors.AppExc.NotFound`), is assumed to possibly hold one.
+        """
+        unwrapped = inspect.unwrap(callable)
+        if (code := getattr(unwrapped, "__code__", None)) is None:
+            return True
+        if not raises_exception(code):
+            return False
+        symbols = self.symbols(unwrapped.__globals__)
+        return any(
+            name in symbols.modules
+            or (
+                (cls := symbols.classes.get(name)) is not None
+                and (
+                    name not in symbols.exceptions
+                    or is_subclass_of_any(cls, self.exceptions_to_find)
+                )
+            )
+            for name in global_names(code)
+        )
+
     def find_service_exceptions(
         self,
         route: APIRoute | Callable,
-    ) -> list[HTTPException]:
-        exceptions = []
+    ) -> list[ExceptionRecord]:
+        exceptions: list[ExceptionRecord] = []
         assert self.serviceClasses is not None
         func = route.endpoint if hasattr(route, "endpoint") else route
-        module = inspect.getmodule(func)
-        source = inspect.getsource(func)
-        tree = ast.parse(source)
-
-        for node in find_nodes(tree, ast.Call, attr_filter={"func": ast.Attribute}):
-            assert isinstance(method := node.func, ast.Attribute)
-
-            cls = None
-            if hasattr(method.value, "func") and hasattr(method.value.func, "id"):
-                try:
-                    cls = getattr(module, method.value.func.id)
-                except (AttributeError, NameError):
-                    ...
-
-            elif hasattr(method.value, "id"):
-                try:
-                    cls = getattr(module, method.value.id)
-                except (AttributeError, NameError):
-                    instance_name = method.value.id
-                    for assignment_node in find_nodes(tree, ast.Assign):
-                        if (
-                            hasattr(assignment_node.targets[0], "id")
-                            and assignment_node.targets[0].id == instance_name
-                        ):
-                            if hasattr(assignment_node.value, "func") and hasattr(
-                                assignment_node.value.func, "id"
-                            ):
-                                try:
-                                    cls = getattr(module, assignment_node.value.func.id)
-                                    break
-                                except (AttributeError, NameError):
-                                    ...
+        if (module := inspect.getmodule(func)) is None:
+            return exceptions
+        symbols = self.symbols(module)
+        summary = self.summarize(func)
+
+        for receiver, attr, instantiated in summary.attr_calls:
+            cls = symbols.get_object(receiver)
+            if cls is None and not instantiated:
+                for constructor in summary.assignments.get(receiver, []):
+                    if (cls := symbols.get_object(constructor)) is not None:
+                        break
 
             if cls:
                 _exceptions = self.search_method_for_excs(
-                    cls, method, self.serviceClasses
+                    cls, attr, self.serviceClasses
                 )
                 if _exceptions:
                     exceptions.extend(_exceptions)
@@ -278,81 +704,40 @@ class RouteExcFinder:
     def find_dependency_exceptions(
         self,
         route: APIRoute | Callable,
-    ) -> list[HTTPException]:
-        exceptions = []
+    ) -> list[ExceptionRecord]:
+        exceptions: list[ExceptionRecord] = []
         assert self.dependencyClasses is not None
         func = route.endpoint if hasattr(route, "endpoint") else route
-        module = inspect.getmodule(func)
-        source = inspect.getsource(func)
-        tree = ast.parse(source)
-
-        for node in chain(
-            find_nodes(tree, ast.FunctionDef), find_nodes(tree, ast.AsyncFunctionDef)
-        ):
-            if hasattr(node, "args"):
-                for kwarg in chain(node.args.defaults, node.args.kw_defaults):
-                    if (
-                        kwarg
-                        and hasattr(kwarg, "func")
-                        and hasattr(kwarg.func, "id")
-                        and kwarg.func.id == "Depends"
-                    ):
-                        if (
-                            method := kwarg.args[0]
-                            if hasattr(kwarg, "args") and kwarg.args
-                            else None
-                        ):
-                            cls = None
-                            if hasattr(method, "value") and hasattr(method.value, "id"):
-                                try:
-                                    cls = getattr(module, method.value.id)
-                                except (AttributeError, NameError):
-                                    ...
-                            elif hasattr(method, "id"):
-                                try:
-                                    cls = getattr(module, method.id)
-                                except (AttributeError, NameError):
-                                    ...
-                            if cls:
-                                _exceptions = self.search_method_for_excs(
-                                    cls, method, self.dependencyClasses
-                                )
-                                if _exceptions:
-                                    exceptions.extend(_exceptions)
+        if (module := inspect.getmodule(func)) is None:
+            return exceptions
+        symbols = self.symbols(module)
+
+        for name, attr in self.summarize(func).depends:
+            if (cls := symbols.get_object(name)) is not None:
+                _exceptions = self.search_method_for_excs(
+                    cls, attr, self.dependencyClasses
+                )
+                if _exceptions:
+                    exceptions.extend(_exceptions)
         return exceptions
 
     def find_annotated_dependency_exceptions(
         self,
         route: APIRoute | Callable,
-    ) -> list[HTTPException]:
-        exceptions = []
+    ) -> list[ExceptionRecord]:
+        exceptions: list[ExceptionRecord] = []
         assert self.dependencyClasses is not None
         func = route.endpoint if hasattr(route, "endpoint") else route
-        module = inspect.getmodule(func)
-        source = inspect.getsource(func)
-        tree = ast.parse(source)
-
-        for node in chain(
-            find_nodes(tree, ast.FunctionDef), find_nodes(tree, ast.AsyncFunctionDef)
-        ):
-            if hasattr(node, "args"):
-                for kwarg in getattr(node.args, "kwonlyargs", []):
-                    if kwarg and hasattr(kwarg, "annotation"):
-                        if (
-                            annot := kwarg.annotation.id
-                            if hasattr(kwarg.annotation, "id") and kwarg.annotation.id
-                            else None
-                        ):
-                            cls = None
-                            try:
-                                cls = getattr(module, annot)
-                            except (AttributeError, NameError):
-                                ...
-                            if cls and (dependency := get_annotated_dependency(cls)):
-                                if _exceptions := self.find_exceptions(
-                                    dependency, module
-                                ):
-                                    exceptions.extend(_exceptions)
+        if (module := inspect.getmodule(func)) is None:
+            return exceptions
+        instances = self.symbols(module).instances
+
+        for annot in self.summarize(func).annotations:
+            if (alias := instances.get(annot)) is not None and (
+                dependency := get_annotated_dependency(alias)
+            ):
+                if _exceptions := self.find_exceptions(dependency, module):
+                    exceptions.extend(_exceptions)
         return exceptions
 
     def create_exc_inst_from_raise_stmt(
@@ -360,37 +745,31 @@ class RouteExcFinder:
         raise_stmt: ast.Raise,
         module: ModuleType | type,
     ) -> Exception | None:
-        if raise_stmt.exc and hasattr(raise_stmt.exc, "func"):
-            if hasattr(raise_stmt.exc.func, "attr"):
-                try:
-                    outer_exc_class = getattr(
-                        module,
-                        raise_stmt.exc.func.value.id,
-                    )
-                    http_exc = getattr(outer_exc_class, raise_stmt.exc.func.attr)
-                except AttributeError:
-                    return None
-                if is_subclass_of_any(http_exc, self.exceptions_to_find):
-                    http_exec_instance = create_exc_instance(http_exc)
-                    return http_exec_instance
-            else:
-                try:
-                    http_exc = getattr(module, raise_stmt.exc.func.id)
-                except AttributeError:
-                    return None
-                if is_subclass_of_any(http_exc, self.exceptions_to_find):
-                    try:
-                        http_exec_instance = eval_ast_exc_instance(
-                            http_exc, raise_stmt.exc
-                        )
-                    except NameError:
-                        http_exec_instance = create_exc_instance(http_exc)
-                    return http_exec_instance
-
-        return None
+        namespace = vars(module) if isinstance(module, ModuleType) else None
+        symbols = self.symbols(module)
+        if not isinstance(call := raise_stmt.exc, ast.Call):
+            return None
+        if isinstance(call.func, ast.Attribute):
+            if (names := dotted_name(call.func)) is None or (
+                http_exc := self.registry.resolve(names, symbols)
+            ) is None:
+                return None
+        elif isinstance(call.func, ast.Name):
+            if (http_exc := symbols.exceptions.get(call.func.id)) is None:
+                return None
+            if not is_subclass_of_any(http_exc, self.exceptions_to_find):
+                return None
+        else:
+            return None
+        if not issubclass(http_exc, Exception):
+            return None
+        try:
+            return eval_ast_exc_instance(http_exc, call, namespace)
+        except NotStatic:
+            return instantiate_exception(http_exc, call, namespace)
 
     def get_class_and_callable(
-        self, cls: type, method: ast.Attribute, types_to_find: tuple[type, ...]
+        self, cls: type, attr: str | None, types_to_find: tuple[type, ...]
     ) -> tuple[type, str]:
         callable = ""
 
@@ -399,20 +778,27 @@ class RouteExcFinder:
                 assert hasattr(cls, "__call__")
                 callable = cls.__call__.__name__
             else:
-                callable = method.attr
+                callable = attr or ""
             cls = cls.__class__
 
         elif is_subclass_of_any(cls, types_to_find):
-            callable = method.attr
+            callable = attr or ""
 
         return cls, callable
 
     def search_method_for_excs(
-        self, cls: type, method: ast.Attribute, types_to_find: tuple[type, ...]
-    ) -> list[HTTPException | ErrType]:
-        exceptions = []
+        self, cls: type, attr: str | None, types_to_find: tuple[type, ...]
+    ) -> list[ExceptionRecord]:
+        cls, callable = self.get_class_and_callable(cls, attr, types_to_find)
+        return self.memoize(
+            ("method", cls, callable, types_to_find),
+            lambda: self._search_method_for_excs(cls, callable, types_to_find),
+        )
 
-        cls, callable = self.get_class_and_callable(cls, method, types_to_find)
+    def _search_method_for_excs(
+        self, cls: type, callable: str, types_to_find: tuple[type, ...]
+    ) -> list[ExceptionRecord]:
+        exceptions = []
 
         nested_to_search = (
             self.serviceClasses
@@ -433,5 +819,8 @@ class RouteExcFinder:
         return exceptions
 
     def clear(self) -> None:
-        self.functions.clear()
-        self.exceptions.clear()
+        """Kept for backwards compatibility.
+
+        Finders no longer hold any per-route state to clear between routes,
+        and memoized exceptions are kept for the lifetime of the finder.
+        """
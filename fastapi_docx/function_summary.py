@@ -0,0 +1,96 @@
+import ast
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+
+class AttrCall(NamedTuple):
+    receiver: str
+    attr: str
+    instantiated: bool
+
+
+class DependsRef(NamedTuple):
+    name: str
+    attr: str | None
+
+
+@dataclass
+class FunctionSummary:
+    """Everything the exception finder needs from the source of one callable.
+
+    Built in a single `ast.walk` over the tree, so entries keep the order
+    in which the finder previously discovered them.
+
+    Attributes:
+        `names`: Every `ast.Name` id referenced.
+        `raises`: Raise statements whose exception is a call, e.g. `raise HTTPException(...)`.
+        `attr_calls`: Method calls on a name, e.g. `Service.method()`, `Service().method()` or `obj.method()`.
+        `depends`: Objects passed to `Depends(...)` as argument defaults of any function in the tree.
+        `annotations`: Names used to annotate keyword-only arguments, e.g. `user: CurrentUser`.
+        `assignments`: Local names mapped to the names of the callables they were assigned from, e.g. `obj = Service()`.
+    """
+
+    tree: ast.Module
+    names: list[str] = field(default_factory=list)
+    raises: list[ast.Raise] = field(default_factory=list)
+    attr_calls: list[AttrCall] = field(default_factory=list)
+    depends: list[DependsRef] = field(default_factory=list)
+    annotations: list[str] = field(default_factory=list)
+    assignments: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_tree(cls, tree: ast.Module) -> "FunctionSummary":
+        summary = cls(tree)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                summary.names.append(node.id)
+            elif isinstance(node, ast.Raise):
+                if isinstance(node.exc, ast.Call):
+                    summary.raises.append(node)
+            elif isinstance(node, ast.Call):
+                summary._add_call(node)
+            elif isinstance(node, ast.Assign):
+                summary._add_assignment(node)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                summary._add_function_def(node)
+        return summary
+
+    def _add_call(self, node: ast.Call) -> None:
+        if not isinstance(method := node.func, ast.Attribute):
+            return
+        receiver = method.value
+        if isinstance(receiver, ast.Call) and isinstance(receiver.func, ast.Name):
+            self.attr_calls.append(AttrCall(receiver.func.id, method.attr, True))
+        elif isinstance(receiver, ast.Name):
+            self.attr_calls.append(AttrCall(receiver.id, method.attr, False))
+
+    def _add_assignment(self, node: ast.Assign) -> None:
+        target = node.targets[0]
+        value = node.value
+        if (
+            isinstance(target, ast.Name)
+            and isinstance(value, ast.Call)
+            and isinstance(value.func, ast.Name)
+        ):
+            self.assignments.setdefault(target.id, []).append(value.func.id)
+
+    def _add_function_def(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        for kwarg in (*node.args.defaults, *node.args.kw_defaults):
+            if (
+                isinstance(kwarg, ast.Call)
+                and isinstance(kwarg.func, ast.Name)
+                and kwarg.func.id == "Depends"
+                and kwarg.args
+            ):
+                dependency = kwarg.args[0]
+                if isinstance(dependency, ast.Attribute) and isinstance(
+                    dependency.value, ast.Name
+                ):
+                    self.depends.append(
+                        DependsRef(dependency.value.id, dependency.attr)
+                    )
+                elif isinstance(dependency, ast.Name):
+                    self.depends.append(DependsRef(dependency.id, None))
+        for kwonlyarg in node.args.kwonlyargs:
+            if isinstance(kwonlyarg.annotation, ast.Name):
+                self.annotations.append(kwonlyarg.annotation.id)
@@ -0,0 +1,63 @@
+import ast
+from dataclasses import dataclass, field
+
+from fastapi_docx.function_summary import FunctionSummary
+
+Definition = ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+
+
+@dataclass
+class ModuleIndex:
+    """Every function, method and class defined in one source file, from a single parse of the whole file.
+
+    Definitions nested in classes and functions are included. Summaries are built the first time they're requested.
+
+    Attributes:
+        `definitions`: The first line of each definition (counting from 1, including decorators) mapped to its node.
+            Each node's `end_lineno` is the last line of the definition.
+        `qualnames`: The qualified name of each definition mapped to its first line.
+    """
+
+    definitions: dict[int, Definition] = field(default_factory=dict)
+    qualnames: dict[str, int] = field(default_factory=dict)
+    summaries: dict[int, FunctionSummary] = field(default_factory=dict)
+
+    @classmethod
+    def from_source(cls, source: str) -> "ModuleIndex":
+        index = cls()
+        try:
+            index._add_definitions(ast.parse(source).body, "")
+        except SyntaxError:
+            pass
+        return index
+
+    def _add_definitions(self, body: list[ast.stmt], prefix: str) -> None:
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                first_line = min(
+                    [
+                        node.lineno,
+                        *(decorator.lineno for decorator in node.decorator_list),
+                    ]
+                )
+                qualname = prefix + node.name
+                self.definitions[first_line] = node
+                self.qualnames.setdefault(qualname, first_line)
+                # Names defined in a function body are local to it.
+                self._add_definitions(
+                    node.body,
+                    f"{qualname}."
+                    if isinstance(node, ast.ClassDef)
+                    else f"{qualname}.<locals>.",
+                )
+
+    def summarize(self, first_line: int, name: str) -> FunctionSummary | None:
+        """Return the summary of the definition of `name` starting on `first_line`, if there is one."""
+        if (summary := self.summaries.get(first_line)) is None:
+            node = self.definitions.get(first_line)
+            if node is None or node.name != name:
+                return None
+            summary = self.summaries[first_line] = FunctionSummary.from_tree(
+                ast.Module(body=[node], type_ignores=[])
+            )
+        return summary
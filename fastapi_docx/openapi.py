@@ -1,16 +1,44 @@
-from collections.abc import Callable
+import logging
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import partial
 from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.routing import Route
 
-from fastapi_docx.exception_finder import ErrType, RouteExcFinder
+from fastapi_docx.exception_finder import Engine, ErrType, RouteExcFinder
 from fastapi_docx.response_generator import (
     ErrSchema,
     HTTPExceptionSchema,
-    add_model_to_openapi,
+    add_models_to_openapi,
+    add_route_extension,
     write_response,
 )
+from fastapi_docx.route_scanner import PoolType, scan_routes
+from fastapi_docx.spec_cache import (
+    SpecCache,
+    class_source_files,
+    qualified_name,
+    read_json,
+    route_table,
+)
+
+logger = logging.getLogger(__name__)
+
+# Set while the `build` command builds a spec, so that apps configured with a `prebuilt_spec`
+# are searched for exceptions rather than served the file being rebuilt.
+ignore_prebuilt_spec: ContextVar[bool] = ContextVar(
+    "ignore_prebuilt_spec", default=False
+)
 
 
 def custom_openapi(
@@ -18,8 +46,17 @@ def custom_openapi(
     customError: type[ErrType] | None = None,
     customErrSchema: type[ErrSchema] | None = None,
     HTTPExcSchema: type[ErrSchema] = HTTPExceptionSchema,
-    dependencyClasses: tuple[type] | None = None,
-    serviceClasses: tuple[type] | None = None,
+    dependencyClasses: tuple[type, ...] | None = None,
+    serviceClasses: tuple[type, ...] | None = None,
+    max_depth: int | None = None,
+    max_functions: int | None = None,
+    cache_dir: str | os.PathLike | None = None,
+    prebuilt_spec: str | os.PathLike | None = None,
+    workers: int | None = None,
+    pool: PoolType = "process",
+    time_budget: float | None = None,
+    complete_in_background: bool = False,
+    engine: Engine = "ast",
 ) -> Callable:
     """Modify the OpenAPI specification for a FastAPI app to include any `HTTPException` raised in service classes and/or dependency classes.
 
@@ -41,35 +78,208 @@ def custom_openapi(
                              You can subclass all dependencies and pass only the base e.g. `dependencyClasses=(BaseDependency,)`
         `serviceClasses`: A tuple of classes that represent service classes for the app's routes.
                           You can subclass all services and pass only the base e.g. `serviceClasses=(BaseService,)`
+        `max_depth`: The maximum depth of nested function calls to follow from each route. Unlimited by default.
+        `max_functions`: The maximum number of functions to search for exceptions per route. Unlimited by default.
+                         Operations of routes that reach either limit are marked with `x-fastapi-docx-truncated: true`.
+        `cache_dir`: An optional directory in which to cache the generated specification between processes.
+                     A cached spec is reused until the routes, the classes above, fastapi-docx
+                     or any of the source files scanned to build it change.
+        `prebuilt_spec`: An optional path to a specification generated ahead of time with
+                         `python -m fastapi_docx build`. It is loaded the first time the spec is requested,
+                         without searching the app for exceptions. If the file can't be read, the spec is built as usual.
+                         It's ignored by `python -m fastapi_docx build`, which always searches the app.
+        `workers`: The number of workers with which to search routes for exceptions in parallel.
+                   Routes are searched one after another by default. The spec is identical either way.
+        `pool`: Whether to use a pool of `"process"` (the default) or `"thread"` workers.
+                Process pools fork the current process. They fall back to threads on platforms that can't fork,
+                and when the spec is built off the main thread (e.g. by `prewarm_openapi` or `offload_openapi`).
+        `time_budget`: An optional number of seconds after which to stop searching routes for exceptions.
+                       Routes that haven't been searched by then keep FastAPI's default responses,
+                       and their operations are marked with `x-fastapi-docx-incomplete: true`.
+        `complete_in_background`: If the `time_budget` runs out, finish searching every route in a background thread
+                                  and then replace the incomplete specification with the complete one.
+        `engine`: Find exceptions by parsing the source of the app (`"ast"`, the default) or by decompiling its bytecode
+                  (`"bytecode"`). The bytecode engine works without source files, e.g. in zipapps or `.pyc`-only images.
     Returns:
         A callable that returns the modified OpenAPI specification as a dictionary or else None.
     """
 
+    spec_cache = SpecCache(cache_dir) if cache_dir is not None else None
+    classes = (
+        customError,
+        customErrSchema,
+        HTTPExcSchema,
+        *(dependencyClasses or ()),
+        *(serviceClasses or ()),
+    )
+
+    build_lock = threading.Lock()
+
     def _custom_openapi() -> Any:
         if app.openapi_schema:
             return app.openapi_schema
+        # Concurrent callers wait for the first caller's build rather than starting their own.
+        with build_lock:
+            if app.openapi_schema:
+                return app.openapi_schema
+            deadline = (
+                time.monotonic() + time_budget if time_budget is not None else None
+            )
+            openapi_schema, complete = _build_openapi(deadline)
+            app.openapi_schema = openapi_schema
+            if not complete and complete_in_background:
+                threading.Thread(
+                    target=_complete_openapi, name="complete-openapi", daemon=True
+                ).start()
+            # Return the spec built by this call, even if the background build has already replaced it.
+            return openapi_schema
+
+    def _complete_openapi() -> None:
+        start = time.perf_counter()
+        app.openapi_schema, _ = _build_openapi()
+        logger.info("Completed OpenAPI spec in %.2fs", time.perf_counter() - start)
+
+    def _build_openapi(deadline: float | None = None) -> tuple[dict[str, Any], bool]:
+        if prebuilt_spec is not None and not ignore_prebuilt_spec.get():
+            try:
+                return read_json(prebuilt_spec), True
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    "Could not load %s, building OpenAPI spec: %s", prebuilt_spec, e
+                )
         openapi_schema = get_openapi(
             title=app.title,
             version=app.version,
             description=app.description,
             routes=app.routes,
         )
-        add_model_to_openapi(openapi_schema, HTTPExcSchema)
-        if customErrSchema:
-            add_model_to_openapi(openapi_schema, customErrSchema)
-        finder = RouteExcFinder(customError, dependencyClasses, serviceClasses)
-        for route in app.routes:
-            if getattr(route, "include_in_schema", None):
-                for exception in finder.extract_exceptions(route):
-                    write_response(
-                        openapi_schema,
-                        route,
-                        exception,
-                        customError,
-                        customErrSchema,
-                    )
-                finder.clear()
-        app.openapi_schema = openapi_schema
-        return app.openapi_schema
+        if spec_cache:
+            cache_key = spec_cache.key(
+                openapi_schema,
+                route_table(app.routes),
+                [qualified_name(cls) for cls in classes if cls],
+                max_depth,
+                max_functions,
+                engine,
+            )
+            if cached_schema := spec_cache.load(cache_key):
+                return cached_schema, True
+        add_models_to_openapi(
+            openapi_schema,
+            [HTTPExcSchema, customErrSchema] if customErrSchema else [HTTPExcSchema],
+        )
+        finder_factory = partial(
+            RouteExcFinder,
+            customError,
+            dependencyClasses,
+            serviceClasses,
+            max_depth,
+            max_functions,
+            engine,
+            # Only the first exception per status code is written to the spec.
+            first_per_status=True,
+        )
+        routes = [
+            route for route in app.routes if getattr(route, "include_in_schema", None)
+        ]
+        source_files = class_source_files(classes)
+        incomplete = 0
+        for route, scan in zip(
+            routes, scan_routes(routes, finder_factory, workers, pool, deadline)
+        ):
+            for exception in scan.records:
+                write_response(
+                    openapi_schema, route, exception, customError, customErrSchema
+                )
+            if scan.truncated:
+                add_route_extension(openapi_schema, route, "x-fastapi-docx-truncated")
+            if not scan.complete:
+                add_route_extension(openapi_schema, route, "x-fastapi-docx-incomplete")
+                incomplete += 1
+            source_files.update(scan.source_files)
+        if incomplete:
+            logger.warning(
+                "Time budget of %ss ran out before %d of %d routes were searched for exceptions",
+                time_budget,
+                incomplete,
+                len(routes),
+            )
+        elif spec_cache:
+            spec_cache.store(cache_key, openapi_schema, source_files)
+        return openapi_schema, not incomplete
 
     return _custom_openapi
+
+
+def prewarm_openapi(app: FastAPI) -> None:
+    """Build the OpenAPI specification for a FastAPI app in a background thread as soon as the app has started.
+
+    Call after setting `app.openapi`, e.g. `app.openapi = custom_openapi(app)`.
+    Requests for the spec that arrive before the build finishes wait for it rather than starting another build.
+
+    Parameters:
+        `app`: The FastAPI app whose OpenAPI specification should be built at startup.
+    """
+    openapi = app.openapi
+    lifespan_context = app.router.lifespan_context
+    build: threading.Thread | None = None
+
+    def _build() -> None:
+        start = time.perf_counter()
+        try:
+            openapi()
+        except Exception:
+            logger.exception("Failed to build OpenAPI spec")
+        else:
+            logger.info("Built OpenAPI spec in %.2fs", time.perf_counter() - start)
+
+    def _openapi() -> Any:
+        if build is not None:
+            build.join()
+        return openapi()
+
+    @asynccontextmanager
+    async def _lifespan(app: Any) -> AsyncIterator[Any]:
+        nonlocal build
+        async with lifespan_context(app) as state:
+            # Start once the app's own startup has finished, so routes added during startup are documented.
+            build = threading.Thread(target=_build, name="prewarm-openapi", daemon=True)
+            build.start()
+            yield state
+
+    app.router.lifespan_context = _lifespan
+    app.openapi = _openapi
+
+
+def offload_openapi(app: FastAPI) -> None:
+    """Serve the OpenAPI specification for a FastAPI app without blocking its event loop.
+
+    FastAPI calls `app.openapi()` directly on the event loop, so every other request waits while the spec is built.
+    This replaces the app's `openapi_url` route with one that builds the spec in a worker thread instead.
+    Call after setting `app.openapi`, e.g. `app.openapi = custom_openapi(app)`.
+
+    Parameters:
+        `app`: The FastAPI app whose OpenAPI specification should be built off the event loop.
+    """
+    if not app.openapi_url:
+        return
+    urls = (server_data.get("url") for server_data in app.servers)
+    server_urls = {url for url in urls if url}
+
+    async def openapi(req: Request) -> JSONResponse:
+        root_path = req.scope.get("root_path", "").rstrip("/")
+        if root_path not in server_urls:
+            if root_path and app.root_path_in_servers:
+                app.servers.insert(0, {"url": root_path})
+                server_urls.add(root_path)
+        return JSONResponse(app.openapi_schema or await run_in_threadpool(app.openapi))
+
+    for i, route in enumerate(app.router.routes):
+        if (
+            isinstance(route, Route)
+            and not isinstance(route, APIRoute)
+            and route.path == app.openapi_url
+        ):
+            app.router.routes[i] = Route(
+                app.openapi_url, openapi, include_in_schema=False
+            )
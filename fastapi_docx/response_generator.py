@@ -1,55 +1,132 @@
+import copy
+import logging
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from fastapi.openapi.constants import REF_TEMPLATE
 from fastapi.routing import APIRoute
 from pydantic import BaseModel
-from pydantic.json_schema import GenerateJsonSchema
+from pydantic.json_schema import GenerateJsonSchema, models_json_schema
 from starlette.exceptions import HTTPException
 
-from fastapi_docx.exception_finder import ErrType
+from fastapi_docx.exception_finder import ErrType, ExceptionRecord, exception_record
 
 ErrSchema = TypeVar("ErrSchema", bound=BaseModel)
 
+logger = logging.getLogger(__name__)
+
 
 class HTTPExceptionSchema(BaseModel):
     detail: str | None = None
 
 
 def get_model_definition(model: type[BaseModel]) -> tuple[str, dict[str, Any]]:
+    # Classes are hashable, but mypy can't tell for models since pydantic isn't followed.
+    model_name, m_schema = _get_model_definition(model)  # type: ignore[arg-type]
+    return model_name, copy.deepcopy(m_schema)
+
+
+@lru_cache(maxsize=256)
+def _get_model_definition(model: type[BaseModel]) -> tuple[str, dict[str, Any]]:
     model_name = model.__name__
     schema_generator = GenerateJsonSchema(by_alias=True, ref_template=REF_TEMPLATE)
     m_schema = schema_generator.generate(
         model.__pydantic_core_schema__, mode="serialization"
     )
+    return model_name, strip_description(m_schema)
+
+
+def get_model_definitions(
+    models: Iterable[type[BaseModel]],
+) -> dict[str, dict[str, Any]]:
+    """Generate the schemas of several models in one pass, including the models nested in them.
+
+    Nested models shared by several of the models are defined once. Definitions are cached per set of models.
+    """
+    return copy.deepcopy(_get_model_definitions(tuple(dict.fromkeys(models))))
+
+
+@lru_cache(maxsize=256)
+def _get_model_definitions(
+    models: tuple[type[BaseModel], ...]
+) -> dict[str, dict[str, Any]]:
+    _, definitions = models_json_schema(
+        [(model, "serialization") for model in models],
+        by_alias=True,
+        ref_template=REF_TEMPLATE,
+    )
+    return {
+        model_name: strip_description(m_schema)
+        for model_name, m_schema in definitions.get("$defs", {}).items()
+    }
+
+
+def strip_description(m_schema: dict[str, Any]) -> dict[str, Any]:
     if "description" in m_schema:
         m_schema["description"] = m_schema["description"].split("\f")[0]
-    return model_name, m_schema
+    return m_schema
 
 
-def add_model_to_openapi(api_schema: dict[str, Any], model: type[BaseModel]) -> None:
-    model_name, m_schema = get_model_definition(model)
+def _component_schemas(api_schema: dict[str, Any]) -> dict[str, Any]:
     if "components" not in api_schema:
         api_schema["components"] = {"schemas": {}}
     if "schemas" not in api_schema["components"]:
         api_schema["components"]["schemas"] = {}
-    api_schema["components"]["schemas"][model_name] = m_schema
+    schemas: dict[str, Any] = api_schema["components"]["schemas"]
+    return schemas
+
+
+def _add_schemas(api_schema: dict[str, Any], definitions: dict[str, Any]) -> None:
+    """Add schemas to the components of a spec, keeping any different schema the app already has by the same name."""
+    schemas = _component_schemas(api_schema)
+    for name, m_schema in definitions.items():
+        if name in schemas and schemas[name] != m_schema:
+            logger.warning(
+                "Not documenting schema %s: the spec already has a different schema by that name",
+                name,
+            )
+            continue
+        schemas[name] = m_schema
+
+
+def add_model_to_openapi(api_schema: dict[str, Any], model: type[BaseModel]) -> None:
+    model_name, m_schema = get_model_definition(model)
+    _add_schemas(api_schema, {model_name: m_schema})
+
+
+def add_models_to_openapi(
+    api_schema: dict[str, Any], models: Iterable[type[BaseModel]]
+) -> None:
+    """Add the schemas of several models (and of any models nested in them) to the components of a spec.
+
+    Schemas already in the spec under the same names, e.g. the app's own models, are left as they are.
+    """
+    _add_schemas(api_schema, get_model_definitions(models))
 
 
 def write_response(
     api_schema: dict,
     route: APIRoute,
-    exc: HTTPException,
+    exc: ExceptionRecord | HTTPException | ErrType,
     customError: type[ErrType] | None,
     customErrSchema: type[ErrSchema] | None,
 ) -> None:
+    """Document an exception as a response of every operation of a route, unless its status code already is.
+
+    `exc` is an `ExceptionRecord`, or an exception instance (as before records were introduced),
+    which is recorded first. `customError` is only used to tell whether an instance is a custom error.
+    """
+    if not isinstance(exc, ExceptionRecord):
+        exc = exception_record(exc, customError)
     path = getattr(route, "path")
     methods = [method.lower() for method in getattr(route, "methods")]
     for method in methods:
         status_code = str(exc.status_code)
         if status_code not in api_schema["paths"][path][method]["responses"]:
-            if customError and customErrSchema and isinstance(exc, customError):
+            if customErrSchema and exc.custom:
                 api_schema["paths"][path][method]["responses"][status_code] = {
-                    "description": exc.__class__.__name__,
+                    "description": exc.name,
                     "content": {
                         "application/json": {
                             "schema": {
@@ -69,3 +146,12 @@ def write_response(
                         }
                     },
                 }
+
+
+def add_route_extension(
+    api_schema: dict, route: APIRoute, name: str, value: Any = True
+) -> None:
+    """Set an OpenAPI specification extension (`x-...` field) on every operation of a route."""
+    path = getattr(route, "path")
+    for method in getattr(route, "methods"):
+        api_schema["paths"][path][method.lower()][name] = value
@@ -0,0 +1,118 @@
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, NamedTuple
+
+from fastapi_docx.exception_finder import (
+    ExceptionRecord,
+    RouteExcFinder,
+    TimeBudgetExceeded,
+)
+
+logger = logging.getLogger(__name__)
+
+PoolType = Literal["process", "thread"]
+
+
+class RouteScan(NamedTuple):
+    records: list[ExceptionRecord]
+    truncated: bool
+    # Source files scanned for this route that the finder hadn't reported for an earlier route.
+    source_files: list[str]
+    # False if the deadline passed before the route was searched. No records are returned for it.
+    complete: bool = True
+
+
+def scan_route(
+    finder: RouteExcFinder,
+    route: Any,
+    reported: set[str],
+    deadline: float | None = None,
+) -> RouteScan:
+    try:
+        records = list(finder.extract_exceptions(route, deadline))
+        complete = True
+    except TimeBudgetExceeded:
+        records, complete = [], False
+    source_files = finder.scanned_files() - reported
+    reported |= source_files
+    return RouteScan(
+        records, finder.is_truncated(route), sorted(source_files), complete
+    )
+
+
+# State shared with pool workers. Process workers are forked, so they inherit it without pickling the app.
+_scan_lock = threading.Lock()
+_routes: Sequence[Any] = ()
+_finder_factory: Callable[[], RouteExcFinder] | None = None
+_deadline: float | None = None
+_worker = threading.local()
+
+
+def _init_worker(shared_finder: RouteExcFinder | None = None) -> None:
+    assert _finder_factory is not None
+    # Threads share one finder (and so its memo); each process creates its own.
+    _worker.finder = shared_finder or _finder_factory()
+    _worker.reported = set()
+
+
+def _scan_route_at(index: int) -> RouteScan:
+    return scan_route(_worker.finder, _routes[index], _worker.reported, _deadline)
+
+
+def _create_pool(
+    workers: int, pool: PoolType, finder_factory: Callable[[], RouteExcFinder]
+) -> Executor:
+    if pool == "process":
+        if threading.current_thread() is not threading.main_thread():
+            # Forking while other threads hold locks (e.g. logging or import locks) can deadlock the workers.
+            logger.info(
+                "Process pools are only forked from the main thread, using threads"
+            )
+        elif "fork" in multiprocessing.get_all_start_methods():
+            return ProcessPoolExecutor(
+                workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            )
+        logger.warning("Process pools need the 'fork' start method, using threads")
+    return ThreadPoolExecutor(
+        workers, initializer=_init_worker, initargs=(finder_factory(),)
+    )
+
+
+def scan_routes(
+    routes: Sequence[Any],
+    finder_factory: Callable[[], RouteExcFinder],
+    workers: int | None = None,
+    pool: PoolType = "process",
+    deadline: float | None = None,
+) -> list[RouteScan]:
+    """Find the exceptions raised by each route, in the same order as `routes`.
+
+    Routes that can't be searched before the `deadline` (in terms of `time.monotonic()`) are marked incomplete.
+
+    With more than one worker, routes are spread over a pool of processes, each with its own
+    `RouteExcFinder`, or over a pool of threads sharing one `RouteExcFinder`. Only plain `ExceptionRecord`s are returned from the workers,
+    so the results are identical to a serial scan.
+    """
+    if not workers or workers <= 1 or len(routes) <= 1:
+        finder = finder_factory()
+        reported: set[str] = set()
+        return [scan_route(finder, route, reported, deadline) for route in routes]
+
+    global _routes, _finder_factory, _deadline
+    with _scan_lock:
+        _routes, _finder_factory, _deadline = routes, finder_factory, deadline
+        try:
+            with _create_pool(workers, pool, finder_factory) as executor:
+                chunksize = max(1, len(routes) // (workers * 4))
+                return list(
+                    executor.map(
+                        _scan_route_at, range(len(routes)), chunksize=chunksize
+                    )
+                )
+        finally:
+            _routes, _finder_factory, _deadline = (), None, None
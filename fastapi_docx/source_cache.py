@@ -0,0 +1,114 @@
+import inspect
+import linecache
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from threading import Lock
+from typing import Any
+
+from fastapi_docx.function_summary import FunctionSummary
+from fastapi_docx.module_index import ModuleIndex
+
+
+@dataclass
+class SourceFile:
+    """The lines of one source file, with the index of every definition in it.
+
+    The file is parsed the first time its index is needed.
+
+    Attributes:
+        `lines`: The lines of the file, as returned by `linecache`.
+    """
+
+    lines: list[str]
+
+    @cached_property
+    def index(self) -> ModuleIndex:
+        return ModuleIndex.from_source("".join(self.lines))
+
+
+class SourceCache:
+    """A bounded LRU cache of source files, each read (from `linecache`) and parsed once,
+    shared by every callable defined in them.
+
+    Entries are invalidated when the modification time of a file changes.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._files: OrderedDict[str, tuple[int | None, SourceFile]] = OrderedDict()
+        self._lock = Lock()
+
+    def get_file(self, filename: str, module_globals: Any = None) -> SourceFile | None:
+        try:
+            mtime: int | None = os.stat(filename).st_mtime_ns
+        except OSError:
+            mtime = None
+        with self._lock:
+            cached = self._files.get(filename)
+            if cached and cached[0] == mtime:
+                self._files.move_to_end(filename)
+                return cached[1]
+        linecache.checkcache(filename)
+        if not (lines := linecache.getlines(filename, module_globals)):
+            return None
+        source_file = SourceFile(lines)
+        with self._lock:
+            self._files[filename] = (mtime, source_file)
+            self._files.move_to_end(filename)
+            if len(self._files) > self.maxsize:
+                self._files.popitem(last=False)
+        return source_file
+
+    def locate(self, obj: Any) -> tuple[SourceFile, int] | None:
+        """Find the file a function, method or class is defined in, and the first line of its definition.
+
+        Functions are found by the line their code object starts on, and classes by their qualified name.
+        Returns None if the definition isn't in the index of its file (e.g. for lambdas or definitions made by `exec`).
+        """
+        unwrapped = inspect.unwrap(obj)
+        if code := getattr(unwrapped, "__code__", None):
+            filename, first_line = code.co_filename, code.co_firstlineno
+            module_globals = getattr(unwrapped, "__globals__", None)
+        elif isinstance(unwrapped, type):
+            try:
+                filename = inspect.getsourcefile(unwrapped)
+            except TypeError:
+                return None
+            module = inspect.getmodule(unwrapped)
+            module_globals = vars(module) if module else None
+            first_line = None
+        else:
+            return None
+
+        if not filename or not (source_file := self.get_file(filename, module_globals)):
+            return None
+        if first_line is None:
+            first_line = source_file.index.qualnames.get(unwrapped.__qualname__)
+        node = source_file.index.definitions.get(first_line) if first_line else None
+        if node is None or node.name != unwrapped.__name__:
+            return None
+        return source_file, first_line
+
+    def get_summary(self, obj: Any) -> FunctionSummary | None:
+        """Look up the summary of a function, method or class in the index of the file it's defined in."""
+        if (located := self.locate(obj)) is None:
+            return None
+        source_file, first_line = located
+        return source_file.index.summarize(first_line, inspect.unwrap(obj).__name__)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+
+
+source_cache = SourceCache()
+
+
+def index_summary(obj: Any) -> FunctionSummary | None:
+    """Look up the summary of a function, method or class in the index of its module.
+
+    Returns None if it can't be found there (e.g. for lambdas or definitions made by `exec`).
+    """
+    return source_cache.get_summary(obj)
@@ -0,0 +1,109 @@
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections.abc import Iterable
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+try:
+    __version__ = version("fastapi-docx")
+except PackageNotFoundError:
+    __version__ = "unknown"
+
+
+def qualified_name(obj: Any) -> str:
+    return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}"
+
+
+def route_table(routes: Iterable[Any]) -> list[tuple[Any, ...]]:
+    return [
+        (
+            getattr(route, "path", None),
+            sorted(getattr(route, "methods", None) or ()),
+            qualified_name(getattr(route, "endpoint", route)),
+            getattr(route, "include_in_schema", None),
+        )
+        for route in routes
+    ]
+
+
+def class_source_files(classes: Iterable[type | None]) -> set[str]:
+    source_files = set()
+    for cls in classes:
+        try:
+            if cls and (source_file := inspect.getsourcefile(cls)):
+                source_files.add(source_file)
+        except TypeError:
+            ...
+    return source_files
+
+
+def hash_file(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def write_json(path: str | os.PathLike, obj: Any) -> None:
+    """Atomically write `obj` to `path` as JSON, streaming it to disk in chunks."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(obj, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_json(path: str | os.PathLike) -> Any:
+    with open(path) as f:
+        return json.load(f)
+
+
+class SpecCache:
+    """An on-disk cache of finished OpenAPI specifications.
+
+    A spec is stored under a hash of everything that determines it besides source code
+    (the fastapi-docx version, the plain FastAPI spec, the route table and the classes passed to `custom_openapi`),
+    together with a manifest of the hashes of every source file scanned to build it.
+    A spec is only loaded if its manifest still matches the files on disk.
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        content = json.dumps([__version__, *parts], sort_keys=True, default=repr)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        try:
+            cached = read_json(self.path(key))
+            sources, openapi_schema = cached["sources"], cached["openapi"]
+            if not isinstance(openapi_schema, dict):
+                return None
+            for path, digest in sources.items():
+                if hash_file(path) != digest:
+                    return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Unreadable or malformed entries are misses, and are replaced by the next `store`.
+            return None
+        return openapi_schema
+
+    def store(
+        self, key: str, openapi_schema: dict[str, Any], source_files: Iterable[str]
+    ) -> None:
+        sources = {path: hash_file(path) for path in sorted(source_files)}
+        write_json(self.path(key), {"sources": sources, "openapi": openapi_schema})
@@ -0,0 +1,130 @@
+import ast
+import operator
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from fastapi import status
+
+# Every `fastapi.status` constant by name, e.g. `HTTP_404_NOT_FOUND`.
+STATUS_CODES: dict[str, int] = {
+    name: getattr(status, name)
+    for name in dir(status)
+    if name.startswith(("HTTP_", "WS_"))
+}
+
+ARITHMETIC_OPERATORS: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+UNARY_OPERATORS: dict[type[ast.unaryop], Callable[[Any], Any]] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+class NotStatic(Exception):
+    """Raised for an expression whose value can't be worked out without running any code."""
+
+
+def describe(node: ast.expr) -> str:
+    """A placeholder for a value only known at runtime, e.g. `<USER.NAME>` for `user.name`."""
+    return f"<{ast.unparse(node).upper()}>"
+
+
+def fold(node: ast.expr, namespace: Mapping[str, Any] | None = None) -> Any:
+    """Work out the value of an expression from its syntax tree alone, without evaluating any code.
+
+    Constants, containers of constants, `fastapi.status` codes, names of number or string constants
+    in `namespace` (e.g. the globals of a module) and arithmetic on numbers are folded to their values.
+    Formatted values in f-strings are replaced by a placeholder (see `describe`), and string concatenations
+    are described as e.g. `<'User '> + <name>`. Any other expression raises `NotStatic`.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return "".join(
+            describe(value.value)
+            if isinstance(value, ast.FormattedValue)
+            else str(fold(value, namespace))
+            for value in node.values
+        )
+    if isinstance(node, ast.Attribute):
+        if (
+            isinstance(node.value, ast.Name)
+            and node.value.id == "status"
+            and node.attr in STATUS_CODES
+        ):
+            return STATUS_CODES[node.attr]
+        raise NotStatic(node)
+    if isinstance(node, ast.Name):
+        if node.id in STATUS_CODES:
+            return STATUS_CODES[node.id]
+        value = namespace.get(node.id) if namespace else None
+        if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+            return value
+        raise NotStatic(node)
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, ast.Add):
+            return f"<{ast.unparse(node.left)}> + <{ast.unparse(node.right)}>"
+        arithmetic = ARITHMETIC_OPERATORS.get(type(node.op))
+        left, right = fold(node.left, namespace), fold(node.right, namespace)
+        if arithmetic and all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in (left, right)
+        ):
+            try:
+                return arithmetic(left, right)
+            except ArithmeticError:
+                raise NotStatic(node)
+        raise NotStatic(node)
+    if isinstance(node, ast.UnaryOp):
+        if (unary := UNARY_OPERATORS.get(type(node.op))) and isinstance(
+            value := fold(node.operand, namespace), (int, float)
+        ):
+            return unary(value)
+        raise NotStatic(node)
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        if any(isinstance(elt, ast.Starred) for elt in node.elts):
+            raise NotStatic(node)
+        elts = [fold(elt, namespace) for elt in node.elts]
+        return (
+            elts
+            if isinstance(node, ast.List)
+            else tuple(elts)
+            if isinstance(node, ast.Tuple)
+            else set(elts)
+        )
+    if isinstance(node, ast.Dict):
+        mapping = {}
+        for key, value in zip(node.keys, node.values):
+            # A key of None unpacks a mapping, e.g. `{**defaults}`.
+            if key is None:
+                raise NotStatic(node)
+            mapping[fold(key, namespace)] = fold(value, namespace)
+        return mapping
+    raise NotStatic(node)
+
+
+def fold_argument(node: ast.expr, namespace: Mapping[str, Any] | None = None) -> Any:
+    """Fold an argument to its value, or to a placeholder describing it if it's only known at runtime."""
+    try:
+        return fold(node, namespace)
+    except NotStatic:
+        return describe(node)
+
+
+def fold_call_arguments(
+    call: ast.Call, namespace: Mapping[str, Any] | None = None
+) -> tuple[list[Any], dict[str, Any]]:
+    """Fold the arguments of a call. Raises `NotStatic` if any are unpacked, e.g. `f(*args)` or `f(**kwargs)`."""
+    if any(isinstance(arg, ast.Starred) for arg in call.args):
+        raise NotStatic(call)
+    kwargs = {}
+    for keyword in call.keywords:
+        if keyword.arg is None:
+            raise NotStatic(call)
+        kwargs[keyword.arg] = fold_argument(keyword.value, namespace)
+    return [fold_argument(arg, namespace) for arg in call.args], kwargs
@@ -0,0 +1,129 @@
+import ast
+import inspect
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any
+
+# Values that are never searched for exceptions.
+IRRELEVANT_TYPES = (ModuleType, int, float, complex, str, bytes, bool, type(None))
+
+
+@dataclass
+class ModuleSymbols:
+    """The names defined in or imported into a module, classified once so each can be resolved with a dict lookup.
+
+    Attributes:
+        `functions`: Plain and `async` functions.
+        `classes`: Every class, including exception classes.
+        `exceptions`: Exception classes.
+        `instances`: Any other objects that may have methods to search, e.g. a dependency instance or an `Annotated` alias.
+        `modules`: Imported modules, e.g. `errors` for `from app import errors`.
+    Constants and `None` aren't included.
+    """
+
+    functions: dict[str, Callable] = field(default_factory=dict)
+    classes: dict[str, type] = field(default_factory=dict)
+    exceptions: dict[str, type[BaseException]] = field(default_factory=dict)
+    instances: dict[str, Any] = field(default_factory=dict)
+    modules: dict[str, ModuleType] = field(default_factory=dict)
+
+    @classmethod
+    def from_namespace(cls, namespace: Mapping[str, Any]) -> "ModuleSymbols":
+        symbols = cls()
+        for name, obj in namespace.items():
+            if inspect.isfunction(obj) or inspect.iscoroutinefunction(obj):
+                symbols.functions[name] = obj
+            elif isinstance(obj, type):
+                symbols.classes[name] = obj
+                if issubclass(obj, BaseException):
+                    symbols.exceptions[name] = obj
+            elif isinstance(obj, ModuleType):
+                symbols.modules[name] = obj
+            elif not isinstance(obj, IRRELEVANT_TYPES):
+                symbols.instances[name] = obj
+        return symbols
+
+    def get_object(self, name: str) -> Any | None:
+        """Return the class or instance of a name, i.e. anything that may own methods to search."""
+        if (obj := self.classes.get(name)) is not None:
+            return obj
+        return self.instances.get(name)
+
+
+def dotted_name(node: ast.expr) -> list[str] | None:
+    """The names of an attribute path, e.g. `["errors", "AppExc", "CreateFailed"]`, or None if it isn't one."""
+    names = []
+    while isinstance(node, ast.Attribute):
+        names.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    names.append(node.id)
+    return names[::-1]
+
+
+@dataclass
+class ExceptionRegistry:
+    """Some exception classes and all of their subclasses, indexed so a dotted raise target resolves with one lookup.
+
+    Attributes:
+        `paths`: Each class by its module and qualified name, e.g. `app.errors.AppExc.CreateFailed`.
+        `qualnames`: Each class by its qualified name alone, e.g. `AppExc.CreateFailed`.
+            A qualified name shared by classes in different modules maps to None.
+    Subclasses defined after the registry is built aren't included.
+    """
+
+    paths: dict[str, type] = field(default_factory=dict)
+    qualnames: dict[str, type | None] = field(default_factory=dict)
+
+    @classmethod
+    def from_classes(cls, classes: Iterable[type]) -> "ExceptionRegistry":
+        registry = cls()
+        to_visit = list(classes)
+        while to_visit:
+            klass = to_visit.pop()
+            path = f"{klass.__module__}.{klass.__qualname__}"
+            if path in registry.paths:
+                continue
+            registry.paths[path] = klass
+            if klass.__qualname__ in registry.qualnames:
+                registry.qualnames[klass.__qualname__] = None
+            else:
+                registry.qualnames[klass.__qualname__] = klass
+            to_visit.extend(klass.__subclasses__())
+        return registry
+
+    def resolve(self, names: list[str], symbols: ModuleSymbols) -> type | None:
+        """Return the registered class an attribute path refers to in a module, e.g. `AppExc.CreateFailed`.
+
+        The first name is looked up in the module's `symbols`, and the rest of the path
+        is appended to the full name of the class or module it refers to. Paths that go through
+        an alias (e.g. `NotFound = NotFoundError` in a namespace class) are walked attribute by attribute instead.
+        """
+        head, rest = names[0], "".join(f".{name}" for name in names[1:])
+        obj: Any
+        if (klass := symbols.classes.get(head)) is not None:
+            if found := self.paths.get(
+                f"{klass.__module__}.{klass.__qualname__}{rest}"
+            ):
+                return found
+            obj = klass
+        elif (module := symbols.modules.get(head)) is not None:
+            # The class may be re-exported by the module rather than defined in it.
+            found = self.paths.get(f"{module.__name__}{rest}")
+            if found := found or self.qualnames.get(rest[1:]):
+                return found
+            obj = module
+        else:
+            return None
+        for name in names[1:]:
+            # Static lookups don't run properties or other descriptors.
+            if (obj := inspect.getattr_static(obj, name, None)) is None:
+                return None
+        if (
+            isinstance(obj, type)
+            and self.paths.get(f"{obj.__module__}.{obj.__qualname__}") is obj
+        ):
+            return obj
+        return None
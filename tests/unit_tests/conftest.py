@@ -697,6 +697,16 @@ def dependencies_openapi_schema(
                             }
                         },
                     },
+                    "500": {
+                        "description": "Could not connect to db",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "$ref": "#/components/schemas/HTTPExceptionSchema"
+                                }
+                            }
+                        },
+                    },
                 },
             },
         }
@@ -0,0 +1,11 @@
+from fastapi import HTTPException
+
+
+class ItemError(HTTPException):
+    status_code = 500
+    detail = "Item error"
+
+
+class ItemNotFound(ItemError):
+    def __init__(self):
+        super().__init__(404, "Item not found")
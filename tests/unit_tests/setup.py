@@ -7,6 +7,7 @@ from fastapi_docx import custom_openapi
 class OpenApiTest:
     def setup_method(self, app: FastAPI, **kwargs) -> None:
         self.app = app
+        self.app.openapi_schema = None
         self.app.openapi = custom_openapi(self.app, **kwargs)
         self.client = TestClient(self.app)
 
@@ -0,0 +1,96 @@
+import ast
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from fastapi_docx.ast_cache import ASTCache, ast_cache, read_source_tree
+from fastapi_docx.exception_finder import RouteExcFinder
+from fastapi_docx.function_summary import FunctionSummary
+from fastapi_docx.source_cache import SourceCache, index_summary
+from tests.unit_tests.fixtures.dependencies import CallableDep, DbDeps, UserDeps
+from tests.unit_tests.setup import OpenApiTest
+from tests.unit_tests.test_service_exceptions import create_user
+
+app = FastAPI()
+
+
+def check_item(item_id: int) -> None:
+    if item_id < 0:
+        raise HTTPException(status_code=400, detail="Negative item id")
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: int) -> int:
+    check_item(item_id)
+    return item_id
+
+
+@app.put("/items/{item_id}")
+def put_item(item_id: int) -> int:
+    check_item(item_id)
+    return item_id
+
+
+class TestASTCache(OpenApiTest):
+    def setup_method(self):
+        super().setup_method(app)
+
+    def test_shared_callee_is_parsed_once_for_all_routes(self):
+        ast_cache.clear()
+        res = self.client.get("/openapi.json")
+        for method in ("get", "put"):
+            assert res.json()["paths"]["/items/{item_id}"][method]["responses"]["400"]
+        info = ast_cache.cache_info()
+        # Only check_item raises, so it's the only function parsed. Callees are found from bytecode,
+        # and the second route reuses the first route's result for check_item without summarizing it again.
+        assert (info.hits, info.misses) == (0, 1)
+
+    def test_finders_share_cache(self):
+        ast_cache.clear()
+        RouteExcFinder().find_exceptions(check_item)
+        RouteExcFinder().find_exceptions(check_item)
+        assert ast_cache.cache_info().hits == 1
+
+
+def test_cache_is_bounded():
+    cache = ASTCache(maxsize=1)
+    cache.summarize(get_item)
+    cache.summarize(put_item)
+    cache.summarize(get_item)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 3, 1)
+
+
+def test_summary_collects_call_sites():
+    summary = ast_cache.summarize(create_user)
+    assert [(call.receiver, call.attr) for call in summary.attr_calls] == [
+        ("router", "post"),
+        ("UserService", "create_user"),
+        ("user_serv", "do_something"),
+        ("AppExc", "CreateFailed"),
+    ]
+    assert summary.assignments["user_serv"] == ["UserService"]
+    assert len(summary.raises) == 2
+
+
+@pytest.mark.parametrize(
+    "obj", [UserDeps, UserDeps.get_current_user, DbDeps.get_db, CallableDep.__call__]
+)
+def test_index_summary_matches_source_summary(obj):
+    summary = index_summary(obj)
+    source_summary = FunctionSummary.from_tree(read_source_tree(obj))
+    assert summary is not None
+    assert summary.names == source_summary.names
+    assert summary.attr_calls == source_summary.attr_calls
+    assert summary.depends == source_summary.depends
+    assert len(summary.raises) == len(source_summary.raises)
+
+
+def test_modules_are_parsed_once():
+    with mock.patch(
+        "fastapi_docx.source_cache.source_cache", SourceCache()
+    ), mock.patch("ast.parse", wraps=ast.parse) as parse:
+        for obj in (UserDeps, UserDeps.get_current_user, DbDeps.get_db, CallableDep):
+            index_summary(obj)
+    parse.assert_called_once()
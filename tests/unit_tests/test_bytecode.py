@@ -0,0 +1,102 @@
+import importlib
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from fastapi_docx import custom_openapi
+from fastapi_docx.bytecode import global_names
+from fastapi_docx.exception_finder import Engine, RouteExcFinder
+from tests.unit_tests.fixtures import custom_exceptions
+from tests.unit_tests.fixtures.custom_exceptions import (
+    AppExceptionCase,
+    AppExecptionSchema,
+)
+from tests.unit_tests.fixtures.dependencies import AppDeps, CallableDep
+from tests.unit_tests.fixtures.services import AppService
+
+app = FastAPI()
+
+
+def check_item(item_id: int) -> bool:
+    if item_id < 0:
+        raise HTTPException(status_code=400, detail="Negative item id")
+    return True
+
+
+def load_items(item_ids: list[int]) -> list[int]:
+    return [item_id for item_id in item_ids if check_item(item_id)]
+
+
+@app.get("/items")
+def get_items(item_ids: list[int]) -> list[int]:
+    items = load_items(item_ids)
+    return items.copy()
+
+
+def test_global_names_include_nested_code():
+    assert global_names(get_items.__code__) == ("load_items",)
+    assert "check_item" in global_names(load_items.__code__)
+
+
+def test_callees_are_found_without_parsing():
+    finder = RouteExcFinder()
+    assert finder.find_functions(get_items) == [load_items]
+    assert finder.find_functions(load_items) == [check_item]
+    assert finder.extract_exceptions(app.routes[-1])[0].status_code == 400
+
+
+def raise_value_error() -> None:
+    raise ValueError("Not documented")
+
+
+def reraise() -> None:
+    try:
+        check_item(-1)
+    except HTTPException:
+        raise
+
+
+def raise_through_module() -> None:
+    raise custom_exceptions.AppExc.Unauthorized()
+
+
+def test_functions_that_cannot_raise_are_not_parsed():
+    finder = RouteExcFinder()
+    assert finder.may_raise(check_item)
+    assert finder.may_raise(raise_through_module)
+    assert not finder.may_raise(load_items)
+    assert not finder.may_raise(raise_value_error)
+    assert not finder.may_raise(reraise)
+
+
+@pytest.mark.parametrize(
+    "module", ["test_dependency_exceptions", "test_service_exceptions"]
+)
+def test_bytecode_engine_matches_ast_engine(module: str):
+    app = importlib.import_module(f"tests.unit_tests.{module}").app
+
+    def build_openapi(engine: Engine) -> dict:
+        app.openapi_schema = None
+        openapi_schema = custom_openapi(
+            app,
+            customError=AppExceptionCase,
+            customErrSchema=AppExecptionSchema,
+            serviceClasses=(AppService,),
+            dependencyClasses=(AppDeps, CallableDep),
+            engine=engine,
+        )()
+        app.openapi_schema = None
+        return openapi_schema
+
+    assert build_openapi("bytecode") == build_openapi("ast")
+
+
+def test_bytecode_engine_needs_no_source():
+    finder = RouteExcFinder(engine="bytecode")
+    with mock.patch("inspect.getsource", side_effect=OSError) as getsource:
+        exceptions = finder.extract_exceptions(app.routes[-1])
+    getsource.assert_not_called()
+    assert [(exc.status_code, exc.detail) for exc in exceptions] == [
+        (400, "Negative item id")
+    ]
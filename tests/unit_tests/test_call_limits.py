@@ -0,0 +1,57 @@
+from fastapi import FastAPI, HTTPException
+
+from tests.unit_tests.setup import OpenApiTest
+
+app = FastAPI()
+
+
+def is_even(n: int) -> bool:
+    if n < 0:
+        raise HTTPException(status_code=400, detail="Negative number")
+    return True if n == 0 else is_odd(n - 1)
+
+
+def is_odd(n: int) -> bool:
+    return False if n == 0 else is_even(n - 1)
+
+
+def check_parity(n: int) -> None:
+    if not is_even(n):
+        raise HTTPException(status_code=409, detail="Odd number")
+
+
+@app.get("/even/{n}")
+def get_even(n: int) -> int:
+    check_parity(n)
+    return n
+
+
+class TestRecursiveCalls(OpenApiTest):
+    def setup_method(self):
+        super().setup_method(app)
+
+    def test_mutual_recursion_terminates(self):
+        operation = self.client.get("/openapi.json").json()["paths"]["/even/{n}"]["get"]
+        assert {"400", "409"} <= set(operation["responses"])
+        assert "x-fastapi-docx-truncated" not in operation
+
+
+class TestMaxDepth(OpenApiTest):
+    def setup_method(self):
+        super().setup_method(app, max_depth=1)
+
+    def test_max_depth_truncates_route(self):
+        operation = self.client.get("/openapi.json").json()["paths"]["/even/{n}"]["get"]
+        assert "409" in operation["responses"]
+        assert "400" not in operation["responses"]
+        assert operation["x-fastapi-docx-truncated"] is True
+
+
+class TestMaxFunctions(OpenApiTest):
+    def setup_method(self):
+        super().setup_method(app, max_functions=1)
+
+    def test_max_functions_truncates_route(self):
+        operation = self.client.get("/openapi.json").json()["paths"]["/even/{n}"]["get"]
+        assert "409" not in operation["responses"]
+        assert operation["x-fastapi-docx-truncated"] is True
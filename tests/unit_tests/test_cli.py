@@ -0,0 +1,69 @@
+import json
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from fastapi_docx import custom_openapi
+from fastapi_docx.cli import main
+from fastapi_docx.exception_finder import RouteExcFinder
+from tests.unit_tests.fixtures.custom_exceptions import (
+    AppExceptionCase,
+    AppExecptionSchema,
+)
+from tests.unit_tests.fixtures.services import AppService
+from tests.unit_tests.test_service_exceptions import app
+
+FIXTURES = "tests.unit_tests.fixtures"
+
+
+def test_build(tmp_path, services_openapi_schema: dict):
+    output = tmp_path / "openapi.json"
+    main(
+        [
+            "build",
+            "tests.unit_tests.test_service_exceptions:app",
+            "-o",
+            str(output),
+            "--custom-error",
+            f"{FIXTURES}.custom_exceptions:AppExceptionCase",
+            "--custom-err-schema",
+            f"{FIXTURES}.custom_exceptions:AppExecptionSchema",
+            "--service-class",
+            f"{FIXTURES}.services:AppService",
+        ]
+    )
+    assert json.loads(output.read_text()) == services_openapi_schema
+
+
+def test_build_invalid_app(capsys):
+    with pytest.raises(SystemExit):
+        main(["build", "tests.unit_tests.test_service_exceptions", "-o", "x.json"])
+    assert "<module>:<attribute>" in capsys.readouterr().err
+
+
+def test_prebuilt_spec_is_loaded_without_scanning(tmp_path):
+    prebuilt_spec = tmp_path / "openapi.json"
+    prebuilt_spec.write_text(json.dumps({"openapi": "3.1.0", "paths": {}}))
+    app.openapi_schema = None
+    app.openapi = custom_openapi(app, prebuilt_spec=prebuilt_spec)
+
+    with mock.patch.object(RouteExcFinder, "extract_exceptions") as extract:
+        res = TestClient(app).get("/api/v1/openapi.json")
+    assert res.json() == {"openapi": "3.1.0", "paths": {}}
+    extract.assert_not_called()
+
+
+def test_build_ignores_prebuilt_spec(tmp_path, services_openapi_schema: dict):
+    output = tmp_path / "openapi.json"
+    output.write_text(json.dumps({"paths": {"stale": {}}}))
+    app.openapi_schema = None
+    app.openapi = custom_openapi(
+        app,
+        customError=AppExceptionCase,
+        customErrSchema=AppExecptionSchema,
+        serviceClasses=(AppService,),
+        prebuilt_spec=output,
+    )
+    main(["build", "tests.unit_tests.test_service_exceptions:app", "-o", str(output)])
+    assert json.loads(output.read_text()) == services_openapi_schema
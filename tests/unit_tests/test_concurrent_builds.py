@@ -0,0 +1,63 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from fastapi import FastAPI, HTTPException
+
+from fastapi_docx import custom_openapi
+from fastapi_docx.exception_finder import RouteExcFinder
+
+app = FastAPI()
+
+
+def check_item(item_id: int) -> None:
+    if item_id < 0:
+        raise HTTPException(status_code=400, detail="Negative item id")
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: int) -> int:
+    check_item(item_id)
+    raise HTTPException(status_code=404, detail="Item not found")
+
+
+@app.delete("/items/{item_id}")
+def delete_item(item_id: int) -> None:
+    check_item(item_id)
+    raise HTTPException(status_code=409, detail="Item in use")
+
+
+extract_exceptions = RouteExcFinder.extract_exceptions
+
+
+def slow_extract_exceptions(self, route, *args):
+    time.sleep(0.05)
+    return extract_exceptions(self, route, *args)
+
+
+def test_concurrent_requests_share_one_build():
+    app.openapi_schema = None
+    app.openapi = custom_openapi(app)
+    with mock.patch.object(
+        RouteExcFinder, "extract_exceptions", autospec=True
+    ) as extract:
+        extract.side_effect = slow_extract_exceptions
+        with ThreadPoolExecutor(8) as executor:
+            schemas = list(executor.map(lambda _: app.openapi(), range(8)))
+    assert extract.call_count == 2
+    assert all(schema is schemas[0] for schema in schemas)
+
+
+def test_finder_is_reentrant():
+    finder = RouteExcFinder()
+    routes = [route for route in app.routes if route.path == "/items/{item_id}"]
+    with ThreadPoolExecutor(4) as executor:
+        results = list(
+            executor.map(
+                lambda route: {
+                    exc.status_code for exc in finder.extract_exceptions(route)
+                },
+                routes * 4,
+            )
+        )
+    assert results == [{400, 404}, {400, 409}] * 4
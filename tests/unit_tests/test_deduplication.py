@@ -0,0 +1,54 @@
+from unittest import mock
+
+from fastapi import FastAPI, HTTPException, status
+
+from fastapi_docx.exception_finder import RouteExcFinder
+
+
+def authenticate(token: str | None, scopes: list[str]):
+    if token is None:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Not authenticated")
+    if not token.startswith("Bearer "):
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Not authenticated")
+    if token == "Bearer expired":
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Token expired")
+    if "admin" not in scopes:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Not enough permissions")
+
+
+def authorize(token: str | None):
+    authenticate(token, ["admin"])
+    raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Not authenticated")
+
+
+app = FastAPI()
+
+
+@app.get("/admin")
+def get_admin(token: str | None = None):
+    authorize(token)
+    authenticate(token, [])
+
+
+def test_duplicates_are_dropped():
+    finder = RouteExcFinder()
+    with mock.patch.object(
+        finder,
+        "create_exc_inst_from_raise_stmt",
+        wraps=finder.create_exc_inst_from_raise_stmt,
+    ) as create:
+        exceptions = finder.extract_exceptions(app.routes[-1])
+    # The repeated raise statement in `authenticate` is only evaluated once.
+    assert create.call_count == 4
+    assert sorted((exc.status_code, exc.detail) for exc in exceptions) == [
+        (401, "Not authenticated"),
+        (401, "Token expired"),
+        (403, "Not enough permissions"),
+    ]
+
+
+def test_first_per_status():
+    exceptions = RouteExcFinder(first_per_status=True).extract_exceptions(
+        app.routes[-1]
+    )
+    assert sorted(exc.status_code for exc in exceptions) == [401, 403]
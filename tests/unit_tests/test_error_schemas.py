@@ -0,0 +1,62 @@
+from pydantic import BaseModel
+
+from fastapi_docx.response_generator import (
+    _get_model_definition,
+    add_models_to_openapi,
+    get_model_definition,
+)
+
+
+class ErrorContext(BaseModel):
+    obj: str | None = None
+
+
+class NotFoundSchema(BaseModel):
+    detail: str
+    context: ErrorContext
+
+
+class ConflictSchema(BaseModel):
+    """A conflicting resource.\fNot documented."""
+
+    detail: str
+    context: ErrorContext
+
+
+def test_model_definitions_are_cached():
+    hits = _get_model_definition.cache_info().hits
+    name, m_schema = get_model_definition(ConflictSchema)
+    m_schema["title"] = "Changed"
+    assert get_model_definition(ConflictSchema)[1]["title"] == "ConflictSchema"
+    assert _get_model_definition.cache_info().hits == hits + 1
+    assert name == "ConflictSchema"
+    assert m_schema["description"] == "A conflicting resource."
+
+
+def test_models_share_nested_definitions():
+    api_schema = {}
+    add_models_to_openapi(api_schema, [NotFoundSchema, ConflictSchema])
+    schemas = api_schema["components"]["schemas"]
+    assert sorted(schemas) == ["ConflictSchema", "ErrorContext", "NotFoundSchema"]
+    for name in ("NotFoundSchema", "ConflictSchema"):
+        assert "$defs" not in schemas[name]
+        assert schemas[name]["properties"]["context"] == {
+            "$ref": "#/components/schemas/ErrorContext"
+        }
+    assert schemas["ConflictSchema"]["description"] == "A conflicting resource."
+
+
+def test_existing_schemas_are_not_overwritten(caplog):
+    app_context = {"title": "ErrorContext", "type": "object", "properties": {}}
+    api_schema = {"components": {"schemas": {"ErrorContext": app_context}}}
+    add_models_to_openapi(api_schema, [NotFoundSchema])
+    schemas = api_schema["components"]["schemas"]
+    assert schemas["ErrorContext"] is app_context
+    assert "NotFoundSchema" in schemas
+    assert "ErrorContext" in caplog.text
+
+    caplog.clear()
+    api_schema = {}
+    add_models_to_openapi(api_schema, [NotFoundSchema])
+    add_models_to_openapi(api_schema, [NotFoundSchema, ConflictSchema])
+    assert not caplog.text
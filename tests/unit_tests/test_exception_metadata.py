@@ -0,0 +1,138 @@
+from typing import Any
+
+from fastapi import FastAPI, HTTPException
+
+from fastapi_docx.exception_finder import RouteExcFinder
+from tests.unit_tests.fixtures.custom_exceptions import (
+    AppExceptionCase,
+    AppExecptionSchema,
+)
+from tests.unit_tests.setup import OpenApiTest
+
+
+class NotFound(AppExceptionCase):
+    status_code = 404
+    detail = "Not found"
+
+    def __init__(self, context: dict[str, Any]):
+        raise RuntimeError("Needs a database connection")
+
+
+class AppError(HTTPException):
+    status_code = 500
+    detail = "Internal error"
+
+
+class ItemMissing(AppError):
+    def __init__(self):
+        super().__init__(404, "Item missing")
+
+
+class ItemLocked(AppError):
+    status_code = 423
+
+
+class Archived(HTTPException):
+    status_code = 410
+    detail = "Item archived"
+
+
+class PaymentRequired(AppExceptionCase):
+    @classmethod
+    def docx_metadata(cls) -> dict[str, Any]:
+        return {"status_code": 402, "detail": "Payment required"}
+
+
+class Conflict(AppExceptionCase):
+    instances = 0
+
+    def __init__(self, obj: str):
+        Conflict.instances += 1
+        super().__init__(409, f"{obj} already exists")
+
+
+class Gone(AppExceptionCase):
+    instances = 0
+
+    def __init__(self):
+        Gone.instances += 1
+        super().__init__(410, "Gone")
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: int):
+    if item_id < 0:
+        raise NotFound({"item_id": item_id})
+    if item_id == 0:
+        raise PaymentRequired(402, "Upgrade your plan")
+    if item_id == 1:
+        raise Conflict("Item")
+    raise Gone()
+
+
+@app.delete("/items/{item_id}")
+def delete_item(item_id: int):
+    raise Gone()
+
+
+class TestExceptionMetadata(OpenApiTest):
+    def setup_method(self):
+        super().setup_method(
+            app, customError=AppExceptionCase, customErrSchema=AppExecptionSchema
+        )
+
+    def test_custom_errors_are_documented_from_class_metadata(self):
+        responses = self.client.get("/openapi.json").json()["paths"]["/items/{item_id}"]
+        assert {
+            code: responses["get"]["responses"][code]["description"]
+            for code in ("402", "404", "409", "410")
+        } == {
+            "402": "PaymentRequired",
+            "404": "NotFound",
+            "409": "Conflict",
+            "410": "Gone",
+        }
+        assert "410" in responses["delete"]["responses"]
+
+    def test_exceptions_are_instantiated_once_per_class(self):
+        finder = RouteExcFinder(customError=AppExceptionCase)
+        for route in app.routes:
+            finder.extract_exceptions(route)
+        assert Gone.instances <= 1
+        exceptions = finder.extract_exceptions(app.routes[-4])
+        assert sorted((exc.status_code, exc.detail) for exc in exceptions) == [
+            (402, "Payment required"),
+            (404, "Not found"),
+            (409, "Item already exists"),
+            (410, "Gone"),
+        ]
+
+
+@app.put("/items/{item_id}")
+def update_item(item_id: int):
+    if item_id < 0:
+        raise ItemMissing()
+    raise ItemLocked(423)
+
+
+def test_constructors_take_precedence_over_inherited_attributes():
+    exceptions = RouteExcFinder().extract_exceptions(app.routes[-2])
+    assert sorted((exc.status_code, exc.detail) for exc in exceptions) == [
+        (404, "Item missing"),
+        (423, "Locked"),
+    ]
+
+
+@app.post("/items/{item_id}/archive")
+def archive_item(item_id: int):
+    raise Archived()
+
+
+def test_stock_constructors_without_a_status_code_use_class_attributes():
+    exceptions = RouteExcFinder().extract_exceptions(app.routes[-1])
+    assert [(exc.status_code, exc.detail) for exc in exceptions] == [
+        (410, "Item archived")
+    ]
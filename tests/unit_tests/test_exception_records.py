@@ -0,0 +1,41 @@
+import pickle
+
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from fastapi_docx.exception_finder import ExceptionRecord, RouteExcFinder
+from tests.unit_tests.fixtures.custom_exceptions import AppExc, AppExceptionCase
+
+app = FastAPI()
+
+
+@app.post("/users")
+def create_user(name: str):
+    if not name:
+        raise HTTPException(400, "Name required", headers={"X-Error": "name"})
+    raise AppExc.CreateFailed({"obj": "User"})
+
+
+def test_records_are_immutable_and_picklable():
+    record = ExceptionRecord(404, {"obj": "User"}, "AppExc.NotFound", True)
+    with pytest.raises(AttributeError):
+        record.status_code = 500  # type: ignore[misc]
+    assert not hasattr(record, "__dict__")
+    assert record.name == "NotFound"
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert hash(record) == hash(
+        ExceptionRecord(404, {"obj": "Item"}, "AppExc.NotFound", True)
+    )
+
+
+def test_finder_returns_records():
+    exceptions = RouteExcFinder(customError=AppExceptionCase).extract_exceptions(
+        app.routes[-1]
+    )
+    location = (__file__, create_user.__code__.co_firstlineno)
+    assert sorted(exceptions, key=lambda exc: exc.status_code) == [
+        ExceptionRecord(400, "Name required", "HTTPException", False, location),
+        ExceptionRecord(
+            500, "object creation failed", "AppExc.CreateFailed", True, location
+        ),
+    ]
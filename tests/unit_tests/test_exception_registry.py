@@ -0,0 +1,85 @@
+from typing import Any
+from unittest import mock
+
+from fastapi import FastAPI
+
+from fastapi_docx.exception_finder import RouteExcFinder
+from fastapi_docx.symbols import ExceptionRegistry
+from tests.unit_tests.fixtures import custom_exceptions, http_errors
+from tests.unit_tests.fixtures.custom_exceptions import AppExc, AppExceptionCase
+
+Errors = AppExc
+
+
+class Items:
+    class Errors:
+        class Locked(AppExceptionCase):
+            def __init__(self, context: dict[str, Any] | None = None):
+                super().__init__(423, "Item locked", context)
+
+
+class ItemErrors:
+    NotFound = http_errors.ItemNotFound
+
+
+app = FastAPI()
+
+
+@app.delete("/items/{item_id}")
+def delete_item(item_id: int):
+    if item_id < 0:
+        raise Items.Errors.Locked()
+    if item_id == 0:
+        raise custom_exceptions.AppExc.Unauthorized()
+    raise Errors.ConnectionClosed()
+
+
+def test_registry_indexes_subclasses():
+    registry = ExceptionRegistry.from_classes((AppExceptionCase,))
+    assert registry.qualnames["Items.Errors.Locked"] is Items.Errors.Locked
+    assert (
+        registry.paths[f"{custom_exceptions.__name__}.AppExc.CreateFailed"]
+        is AppExc.CreateFailed
+    )
+
+
+def test_dotted_raise_targets_are_resolved():
+    finder = RouteExcFinder(customError=AppExceptionCase)
+    with mock.patch.object(
+        ExceptionRegistry, "from_classes", wraps=ExceptionRegistry.from_classes
+    ) as from_classes:
+        exceptions = finder.extract_exceptions(app.routes[-3])
+    from_classes.assert_called_once()
+    assert sorted(exc.qualname for exc in exceptions) == [
+        "AppExc.ConnectionClosed",
+        "AppExc.Unauthorized",
+        "Items.Errors.Locked",
+    ]
+
+
+def check_owner(owner_id: int):
+    if owner_id != 1:
+        raise custom_exceptions.AppExc.Unauthorized()
+
+
+@app.put("/items/{item_id}/owner")
+def change_owner(item_id: int, owner_id: int):
+    check_owner(owner_id)
+
+
+def test_callees_raising_only_through_a_module_path_are_searched():
+    finder = RouteExcFinder(customError=AppExceptionCase)
+    exceptions = finder.extract_exceptions(app.routes[-2])
+    assert [exc.qualname for exc in exceptions] == ["AppExc.Unauthorized"]
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: int):
+    raise ItemErrors.NotFound()
+
+
+def test_aliased_raise_targets_are_resolved():
+    exceptions = RouteExcFinder().extract_exceptions(app.routes[-1])
+    assert [(exc.status_code, exc.qualname) for exc in exceptions] == [
+        (404, "ItemNotFound")
+    ]
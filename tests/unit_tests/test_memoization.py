@@ -0,0 +1,85 @@
+from unittest import mock
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+
+from fastapi_docx.exception_finder import RouteExcFinder
+from tests.unit_tests.setup import OpenApiTest
+
+
+class AppDeps:
+    pass
+
+
+class AuthDeps(AppDeps):
+    @staticmethod
+    def get_current_user() -> str:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+
+router = APIRouter()
+
+
+@router.get("/items")
+def get_items(user: str = Depends(AuthDeps.get_current_user)):
+    raise HTTPException(status_code=404, detail="No items")
+
+
+@router.get("/orders")
+def get_orders(user: str = Depends(AuthDeps.get_current_user)):
+    return []
+
+
+app = FastAPI()
+app.include_router(router, prefix="/v1")
+app.include_router(router, prefix="/v2")
+
+
+class TestMemoization(OpenApiTest):
+    def setup_method(self):
+        super().setup_method(app, dependencyClasses=(AppDeps,))
+
+    def test_shared_endpoints_are_scanned_once(self):
+        with mock.patch.object(
+            RouteExcFinder,
+            "_extract_exceptions",
+            autospec=True,
+            side_effect=RouteExcFinder._extract_exceptions,
+        ) as extract:
+            paths = self.client.get("/openapi.json").json()["paths"]
+        assert extract.call_count == 2
+        for prefix in ("/v1", "/v2"):
+            assert set(paths[f"{prefix}/items"]["get"]["responses"]) >= {"401", "404"}
+            assert "401" in paths[f"{prefix}/orders"]["get"]["responses"]
+
+    def test_shared_dependencies_are_scanned_once(self):
+        finder = RouteExcFinder(dependencyClasses=(AppDeps,))
+        with mock.patch.object(
+            RouteExcFinder,
+            "_find_exceptions",
+            autospec=True,
+            side_effect=RouteExcFinder._find_exceptions,
+        ) as find:
+            for route in router.routes:
+                finder.extract_exceptions(route)
+                finder.clear()
+        scanned = [call.args[1] for call in find.call_args_list]
+        assert scanned.count(AuthDeps.get_current_user) == 1
+
+
+def search(finder: RouteExcFinder, graph: dict[str, list[str]], key: str) -> list:
+    return finder.memoize(
+        key,
+        lambda: [key]
+        + [found for callee in graph[key] for found in search(finder, graph, callee)],
+    )
+
+
+def test_cycles_memoize_the_same_results_in_any_order():
+    graph = {"a": ["b", "d"], "b": ["c"], "c": ["a", "b"], "d": []}
+    # Each key searched on its own, without anything memoized beforehand.
+    expected = {key: search(RouteExcFinder(), graph, key) for key in graph}
+    for order in (["a", "b", "c", "d"], ["c", "b", "a", "d"], ["d", "b", "a", "c"]):
+        finder = RouteExcFinder()
+        assert {key: search(finder, graph, key) for key in order} == expected
+        # Only results that didn't cut a cycle short are memoized.
+        assert list(finder.memo) == ["d"]
@@ -0,0 +1,59 @@
+import threading
+from unittest import mock
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from fastapi_docx import custom_openapi, offload_openapi
+from fastapi_docx.exception_finder import RouteExcFinder
+
+app = FastAPI()
+
+
+@app.get("/ping")
+def ping() -> str:
+    return "pong"
+
+
+@app.get("/{item_id}")
+def get_item(item_id: int) -> str:
+    if item_id == 0:
+        raise HTTPException(status_code=404, detail="Item not found.")
+    return "Item exists!"
+
+
+app.openapi = custom_openapi(app)
+offload_openapi(app)
+
+extract_exceptions = RouteExcFinder.extract_exceptions
+build_started = threading.Event()
+release_build = threading.Event()
+
+
+def blocked_extract_exceptions(self, route, *args):
+    build_started.set()
+    # Without offloading, the build blocks the event loop until this times out.
+    release_build.wait(timeout=10)
+    return extract_exceptions(self, route, *args)
+
+
+def test_other_requests_are_served_while_spec_builds():
+    app.openapi_schema = None
+    responses = {}
+    with TestClient(app) as client, mock.patch.object(
+        RouteExcFinder, "extract_exceptions", autospec=True
+    ) as extract:
+        extract.side_effect = blocked_extract_exceptions
+        build = threading.Thread(
+            target=lambda: responses.update(openapi=client.get("/openapi.json"))
+        )
+        build.start()
+        assert build_started.wait(timeout=10)
+        assert client.get("/ping").json() == "pong"
+        # The spec is still being built, so the ping didn't wait for it.
+        assert build.is_alive()
+        release_build.set()
+        build.join()
+
+    openapi = responses["openapi"].json()
+    assert "404" in openapi["paths"]["/{item_id}"]["get"]["responses"]
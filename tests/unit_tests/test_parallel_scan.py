@@ -0,0 +1,66 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+
+from fastapi_docx import custom_openapi
+from fastapi_docx.exception_finder import RouteExcFinder
+from fastapi_docx.response_generator import write_response
+from fastapi_docx.route_scanner import _create_pool
+from tests.unit_tests.fixtures.custom_exceptions import (
+    AppExc,
+    AppExceptionCase,
+    AppExecptionSchema,
+)
+from tests.unit_tests.fixtures.dependencies import AppDeps, CallableDep
+from tests.unit_tests.fixtures.services import AppService
+from tests.unit_tests.test_dependency_exceptions import app
+
+
+def build_openapi(**kwargs) -> str:
+    app.openapi_schema = None
+    openapi_schema = custom_openapi(
+        app,
+        customError=AppExceptionCase,
+        customErrSchema=AppExecptionSchema,
+        serviceClasses=(AppService,),
+        dependencyClasses=(AppDeps, CallableDep),
+        **kwargs,
+    )()
+    app.openapi_schema = None
+    return json.dumps(openapi_schema)
+
+
+@pytest.mark.parametrize("pool", ["process", "thread"])
+def test_parallel_scan_matches_serial_scan(pool: str):
+    assert build_openapi(workers=2, pool=pool) == build_openapi()
+
+
+def test_process_pool_is_not_forked_off_the_main_thread():
+    pools = []
+    thread = threading.Thread(
+        target=lambda: pools.append(_create_pool(2, "process", RouteExcFinder))
+    )
+    thread.start()
+    thread.join()
+    pools[0].shutdown()
+    assert isinstance(pools[0], ThreadPoolExecutor)
+
+
+def test_write_response_accepts_exception_instances():
+    api_schema = {"paths": {"/": {"get": {"responses": {}}}}}
+    route = APIRoute("/", lambda: None)
+    write_response(
+        api_schema,
+        route,
+        AppExc.Unauthorized(),
+        AppExceptionCase,
+        AppExecptionSchema,
+    )
+    write_response(api_schema, route, HTTPException(404, "Missing"), None, None)
+    responses = api_schema["paths"]["/"]["get"]["responses"]
+    assert responses["401"]["description"] == "Unauthorized"
+    assert responses["404"]["description"] == "Missing"
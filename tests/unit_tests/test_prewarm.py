@@ -0,0 +1,68 @@
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest import mock
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from fastapi_docx import custom_openapi, prewarm_openapi
+from fastapi_docx.exception_finder import RouteExcFinder
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/{item_id}")
+    def get_item(item_id: int) -> str:
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="Item not found.")
+        return "Item exists!"
+
+    app.openapi = custom_openapi(app)
+    prewarm_openapi(app)
+    return app
+
+
+def test_spec_is_built_at_startup(caplog):
+    app = create_app()
+    with caplog.at_level(logging.INFO), TestClient(app):
+        app.openapi()
+        assert app.openapi_schema
+    assert "Built OpenAPI spec in" in caplog.text
+
+
+def test_requests_wait_for_startup_build():
+    app = create_app()
+    extract_exceptions = RouteExcFinder.extract_exceptions
+
+    def slow_extract_exceptions(self, route, *args):
+        time.sleep(0.2)
+        return extract_exceptions(self, route, *args)
+
+    with mock.patch.object(
+        RouteExcFinder, "extract_exceptions", autospec=True
+    ) as extract:
+        extract.side_effect = slow_extract_exceptions
+        with TestClient(app) as client:
+            res = client.get("/openapi.json")
+    assert "404" in res.json()["paths"]["/{item_id}"]["get"]["responses"]
+    assert extract.call_count == 1
+
+
+def test_routes_added_at_startup_are_documented():
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        @app.delete("/{item_id}")
+        def delete_item(item_id: int) -> None:
+            raise HTTPException(status_code=409, detail="Item in use.")
+
+        yield
+
+    app = FastAPI(lifespan=lifespan)
+    app.openapi = custom_openapi(app)
+    prewarm_openapi(app)
+    with TestClient(app) as client:
+        res = client.get("/openapi.json")
+    assert "409" in res.json()["paths"]["/{item_id}"]["delete"]["responses"]
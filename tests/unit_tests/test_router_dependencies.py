@@ -0,0 +1,96 @@
+from unittest import mock
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+
+from fastapi_docx.exception_finder import RouteExcFinder
+from tests.unit_tests.setup import OpenApiTest
+
+
+class AppDeps:
+    pass
+
+
+def get_token() -> str:
+    raise HTTPException(status_code=401, detail="Missing token")
+
+
+class AuthDeps(AppDeps):
+    @staticmethod
+    def get_current_user(token: str = Depends(get_token)) -> str:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+def get_tenant() -> str:
+    raise HTTPException(status_code=421, detail="Unknown tenant")
+
+
+router = APIRouter(dependencies=[Depends(AuthDeps.get_current_user)])
+
+
+@router.get("/items")
+def get_items():
+    raise HTTPException(status_code=404, detail="No items")
+
+
+@router.get("/orders")
+def get_orders():
+    return []
+
+
+app = FastAPI(dependencies=[Depends(get_tenant)])
+app.include_router(router, prefix="/v1")
+
+
+class TestRouterDependencies(OpenApiTest):
+    def setup_method(self):
+        super().setup_method(app, dependencyClasses=(AppDeps,))
+
+    def test_router_and_app_dependencies(self):
+        paths = self.client.get("/openapi.json").json()["paths"]
+        assert set(paths["/v1/items"]["get"]["responses"]) >= {
+            "401",
+            "403",
+            "404",
+            "421",
+        }
+        assert set(paths["/v1/orders"]["get"]["responses"]) >= {"401", "403", "421"}
+
+    def test_router_dependencies_are_scanned_once(self):
+        finder = RouteExcFinder(dependencyClasses=(AppDeps,))
+        with mock.patch.object(
+            RouteExcFinder,
+            "_find_exceptions",
+            autospec=True,
+            side_effect=RouteExcFinder._find_exceptions,
+        ) as find:
+            for route in app.routes:
+                finder.extract_exceptions(route)
+        scanned = [call.args[1] for call in find.call_args_list]
+        assert scanned.count(AuthDeps.get_current_user) == 1
+        assert scanned.count(get_token) == 1
+
+
+def check_item() -> None:
+    raise HTTPException(status_code=421, detail="Unknown item")
+
+
+items_router = APIRouter()
+
+
+@items_router.put("/items")
+def update_item():
+    check_item()
+
+
+app.include_router(items_router, prefix="/v2")
+
+
+def test_endpoint_exceptions_come_before_dependencies():
+    route = next(
+        route for route in app.routes if getattr(route, "endpoint", None) is update_item
+    )
+    finder = RouteExcFinder(dependencyClasses=(AppDeps,), first_per_status=True)
+    [unknown] = [
+        exc for exc in finder.extract_exceptions(route) if exc.status_code == 421
+    ]
+    assert unknown.detail == "Unknown item"
@@ -0,0 +1,49 @@
+import inspect
+import linecache
+from unittest import mock
+
+import pytest
+
+from fastapi_docx.source_cache import SourceCache
+from tests.unit_tests.fixtures import dependencies
+from tests.unit_tests.fixtures.dependencies import CallableDep, DbDeps, UserDeps
+
+
+def outer():
+    def inner():
+        pass
+
+    return inner
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        UserDeps,
+        UserDeps.get_current_user,
+        UserDeps.instance_method,
+        DbDeps.get_db,
+        CallableDep.__call__,
+        outer,
+        outer(),
+    ],
+)
+def test_definitions_are_located_like_inspect(obj):
+    located = SourceCache().locate(obj)
+    assert located is not None
+    assert located[1] == inspect.getsourcelines(obj)[1]
+
+
+def test_each_file_is_read_once():
+    source_cache = SourceCache()
+    with mock.patch("linecache.getlines", wraps=linecache.getlines) as getlines:
+        for obj in (UserDeps, UserDeps.get_current_user, DbDeps.get_db, CallableDep):
+            source_cache.get_summary(obj)
+    getlines.assert_called_once_with(dependencies.__file__, mock.ANY)
+
+
+def test_files_are_evicted_beyond_maxsize():
+    source_cache = SourceCache(maxsize=1)
+    source_cache.get_summary(outer)
+    source_cache.get_summary(UserDeps)
+    assert list(source_cache._files) == [dependencies.__file__]
@@ -0,0 +1,70 @@
+import json
+from unittest import mock
+
+from fastapi import FastAPI, HTTPException
+
+from fastapi_docx import custom_openapi
+from fastapi_docx.exception_finder import RouteExcFinder
+from tests.unit_tests.fixtures import http_errors
+
+app = FastAPI()
+
+
+@app.get("/{item_id}")
+def get_item(item_id: int) -> str:
+    if item_id == 0:
+        raise HTTPException(status_code=404, detail="Item not found.")
+    return "Item exists!"
+
+
+@app.delete("/{item_id}")
+def delete_item(item_id: int):
+    raise http_errors.ItemNotFound()
+
+
+def build_openapi(cache_dir) -> dict:
+    app.openapi_schema = None
+    return custom_openapi(app, cache_dir=cache_dir)()
+
+
+def test_cached_spec_is_reused(tmp_path):
+    openapi_schema = build_openapi(tmp_path)
+    assert len(cache_files := list(tmp_path.glob("*.json"))) == 1
+    sources = json.loads(cache_files[0].read_text())["sources"]
+    assert __file__ in sources
+
+    with mock.patch.object(RouteExcFinder, "extract_exceptions") as extract:
+        assert build_openapi(tmp_path) == openapi_schema
+    extract.assert_not_called()
+
+
+def test_changed_source_rebuilds_spec(tmp_path):
+    openapi_schema = build_openapi(tmp_path)
+    cache_file = next(tmp_path.glob("*.json"))
+    cached = json.loads(cache_file.read_text())
+    cached["sources"][__file__] = "outdated"
+    cached["openapi"] = {}
+    cache_file.write_text(json.dumps(cached))
+
+    assert build_openapi(tmp_path) == openapi_schema
+    assert json.loads(cache_file.read_text())["sources"][__file__] != "outdated"
+
+
+def test_malformed_entry_rebuilds_spec(tmp_path):
+    openapi_schema = build_openapi(tmp_path)
+    cache_file = next(tmp_path.glob("*.json"))
+    for malformed in (
+        {"openapi": {}},
+        {"sources": {}},
+        {"sources": []},
+        {"sources": {}, "openapi": []},
+        [],
+    ):
+        cache_file.write_text(json.dumps(malformed))
+        assert build_openapi(tmp_path) == openapi_schema
+
+
+def test_exception_class_files_are_listed(tmp_path):
+    build_openapi(tmp_path)
+    sources = json.loads(next(tmp_path.glob("*.json")).read_text())["sources"]
+    assert http_errors.__file__ in sources
@@ -0,0 +1,73 @@
+import ast
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI, HTTPException, status
+
+from fastapi_docx.exception_finder import RouteExcFinder, eval_ast_exc_instance
+from fastapi_docx.static_eval import NotStatic, fold
+
+RETRY_AFTER = "120"
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: int, code: int):
+    if item_id < 0:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            f"Invalid item {item_id}",
+            headers={"Retry-After": RETRY_AFTER},
+        )
+    if item_id == 0:
+        raise HTTPException(status_code=404, detail="Item " + str(item_id))
+    raise HTTPException(status_code=code, detail="Only known at runtime")
+
+
+def fold_expr(expr: str, namespace: dict | None = None):
+    return fold(ast.parse(expr, mode="eval").body, namespace)
+
+
+@pytest.mark.parametrize(
+    "expr, value",
+    [
+        ("404", 404),
+        ("status.HTTP_403_FORBIDDEN", 403),
+        ("HTTP_409_CONFLICT", 409),
+        ("400 * 2 + 4", "<400 * 2> + <4>"),
+        ("-(1 - 3)", 2),
+        ('f"GET {obj} FAIL {400+4}"', "GET <OBJ> FAIL <400 + 4>"),
+        ('{"obj": ["User", (1, 2)]}', {"obj": ["User", (1, 2)]}),
+        ("CODE", 418),
+    ],
+)
+def test_fold(expr: str, value):
+    assert fold_expr(expr, {"CODE": 418}) == value
+
+
+@pytest.mark.parametrize("expr", ["user.name", "get_code()", "CODE", "[*codes]"])
+def test_fold_not_static(expr: str):
+    with pytest.raises(NotStatic):
+        fold_expr(expr, {"CODE": object()})
+
+
+def test_exceptions_are_found_without_eval():
+    with mock.patch("builtins.eval") as eval_:
+        exceptions = RouteExcFinder().extract_exceptions(app.routes[-1])
+    eval_.assert_not_called()
+    assert [(exc.status_code, exc.detail) for exc in exceptions] == [
+        (400, "Invalid item <ITEM_ID>"),
+        (404, "<'Item '> + <str(item_id)>"),
+    ]
+
+
+def test_keyword_arguments_are_folded():
+    [call] = [
+        raise_stmt.exc
+        for raise_stmt in RouteExcFinder().summarize(get_item).raises
+        if isinstance(raise_stmt.exc, ast.Call)
+        and any(keyword.arg == "headers" for keyword in raise_stmt.exc.keywords)
+    ]
+    exc = eval_ast_exc_instance(HTTPException, call, globals())
+    assert exc.headers == {"Retry-After": "120"}
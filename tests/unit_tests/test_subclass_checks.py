@@ -0,0 +1,40 @@
+from fastapi import FastAPI
+
+from fastapi_docx.exception_finder import RouteExcFinder, is_subclass_of_any
+from tests.unit_tests.fixtures import custom_exceptions
+
+
+class ItemError(custom_exceptions.AppExc.ConnectionClosed):
+    pass
+
+
+class ItemLocked(ItemError):
+    pass
+
+
+# Not the configured customError, despite its name.
+class AppExceptionCase(Exception):
+    def __init__(self):
+        self.status_code = 423
+
+
+app = FastAPI()
+
+
+@app.put("/items/{item_id}")
+def update_item(item_id: int):
+    if item_id < 0:
+        raise ItemLocked()
+    raise AppExceptionCase()
+
+
+def test_deep_subclasses_match():
+    assert is_subclass_of_any(ItemLocked, (custom_exceptions.AppExceptionCase,))
+    assert is_subclass_of_any(ItemLocked(), ("AppExceptionCase",))
+    assert not is_subclass_of_any(AppExceptionCase, (ItemError,))
+
+
+def test_classes_are_matched_by_identity():
+    finder = RouteExcFinder(customError=custom_exceptions.AppExceptionCase)
+    exceptions = finder.extract_exceptions(app.routes[-1])
+    assert [exc.qualname for exc in exceptions] == [ItemLocked.__qualname__]
@@ -0,0 +1,49 @@
+from unittest import mock
+
+from fastapi import Depends, FastAPI, HTTPException
+
+from fastapi_docx.exception_finder import RouteExcFinder
+from fastapi_docx.symbols import ModuleSymbols
+from tests.unit_tests.fixtures import dependencies
+from tests.unit_tests.fixtures.custom_exceptions import AppExceptionCase
+from tests.unit_tests.fixtures.dependencies import AppDeps, CurrentUser, UserDeps
+from tests.unit_tests.fixtures.services import AppService, UserService
+
+app = FastAPI()
+
+
+@app.get("/me")
+def get_user(*, user_in, current_user: CurrentUser):
+    return UserService.get_authenticated(user_in)
+
+
+@app.put("/me")
+def update_user(user_in, current_user=Depends(UserDeps.get_current_user_obj)):
+    return UserService.get_authenticated(user_in)
+
+
+def test_names_are_classified():
+    symbols = ModuleSymbols.from_namespace(vars(dependencies))
+    assert symbols.classes["UserDeps"] is UserDeps
+    assert symbols.exceptions["HTTPException"] is HTTPException
+    assert "UserDeps" not in symbols.exceptions
+    assert "Depends" in symbols.functions
+    assert "status" not in symbols.instances
+    assert symbols.instances["CurrentUser"] is not None
+    assert symbols.get_object("UserDeps") is UserDeps
+
+
+def test_modules_are_indexed_once():
+    finder = RouteExcFinder(
+        customError=AppExceptionCase,
+        dependencyClasses=(AppDeps,),
+        serviceClasses=(AppService,),
+    )
+    with mock.patch.object(
+        ModuleSymbols, "from_namespace", wraps=ModuleSymbols.from_namespace
+    ) as from_namespace:
+        for route in app.routes[-2:]:
+            assert finder.extract_exceptions(route)
+    namespaces = [call.args[0] for call in from_namespace.call_args_list]
+    assert namespaces
+    assert len({id(namespace) for namespace in namespaces}) == len(namespaces)
@@ -0,0 +1,63 @@
+import time
+from unittest import mock
+
+from fastapi import FastAPI, HTTPException
+
+from fastapi_docx import custom_openapi
+
+app = FastAPI()
+
+
+@app.get("/{item_id}")
+def get_item(item_id: int) -> str:
+    if item_id == 0:
+        raise HTTPException(status_code=404, detail="Item not found.")
+    return "Item exists!"
+
+
+def get_operation(openapi_schema: dict) -> dict:
+    return openapi_schema["paths"]["/{item_id}"]["get"]
+
+
+def test_spec_within_time_budget_is_complete():
+    app.openapi_schema = None
+    operation = get_operation(custom_openapi(app, time_budget=60)())
+    assert "404" in operation["responses"]
+    assert "x-fastapi-docx-incomplete" not in operation
+
+
+def test_exhausted_time_budget_keeps_default_responses():
+    app.openapi_schema = None
+    operation = get_operation(custom_openapi(app, time_budget=0)())
+    assert set(operation["responses"]) == {"200", "422"}
+    assert operation["x-fastapi-docx-incomplete"] is True
+
+
+def test_spec_is_completed_in_background():
+    app.openapi_schema = None
+    openapi = custom_openapi(app, time_budget=0, complete_in_background=True)
+    assert get_operation(openapi())["x-fastapi-docx-incomplete"] is True
+
+    timeout = time.monotonic() + 5
+    while "x-fastapi-docx-incomplete" in get_operation(openapi()):
+        assert time.monotonic() < timeout
+        time.sleep(0.01)
+    assert "404" in get_operation(openapi())["responses"]
+
+
+class InlineThread:
+    """Runs its target as soon as it's started, i.e. a background build that wins every race."""
+
+    def __init__(self, target, **kwargs):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+def test_first_call_returns_the_spec_it_built():
+    app.openapi_schema = None
+    openapi = custom_openapi(app, time_budget=0, complete_in_background=True)
+    with mock.patch("fastapi_docx.openapi.threading.Thread", InlineThread):
+        assert get_operation(openapi())["x-fastapi-docx-incomplete"] is True
+    assert "404" in get_operation(openapi())["responses"]